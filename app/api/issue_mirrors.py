@@ -45,10 +45,8 @@ async def wait_for_manual_syncs(timeout: int = 300):
     logger.info(f"Waiting for {active_count} manual sync task(s) to complete (timeout: {timeout}s)...")
 
     try:
-        results = await asyncio.wait_for(
-            asyncio.gather(*tasks_snapshot, return_exceptions=True),
-            timeout=timeout
-        )
+        async with asyncio.timeout(timeout):
+            results = await asyncio.gather(*tasks_snapshot, return_exceptions=True)
         # Check for and log any exceptions from the gathered tasks
         exceptions = [r for r in results if isinstance(r, Exception)]
         if exceptions:
@@ -57,7 +55,7 @@ async def wait_for_manual_syncs(timeout: int = 300):
             logger.warning(f"All manual sync tasks finished, but {len(exceptions)} task(s) raised exceptions")
         else:
             logger.info("All manual sync tasks completed gracefully")
-    except asyncio.TimeoutError:
+    except TimeoutError:
         remaining = [t for t in tasks_snapshot if not t.done()]
         logger.warning(
             f"Timeout waiting for manual sync tasks after {timeout}s. "
@@ -189,10 +189,8 @@ class IssueScheduler:
         logger.info(f"Waiting for {active_count} active sync job(s) to complete (timeout: {settings.sync_shutdown_timeout}s)...")
 
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks_snapshot, return_exceptions=True),
-                timeout=settings.sync_shutdown_timeout
-            )
+            async with asyncio.timeout(settings.sync_shutdown_timeout):
+                results = await asyncio.gather(*tasks_snapshot, return_exceptions=True)
             # Check for and log any exceptions from the gathered tasks
             exceptions = [r for r in results if isinstance(r, Exception)]
             if exceptions:
@@ -201,7 +199,7 @@ class IssueScheduler:
                 logger.warning(f"All sync jobs finished, but {len(exceptions)} task(s) raised exceptions")
             else:
                 logger.info("All sync jobs completed gracefully")
-        except asyncio.TimeoutError:
+        except TimeoutError:
             remaining = [t for t in tasks_snapshot if not t.done()]
             logger.warning(
                 f"Timeout waiting for sync jobs to complete after {settings.sync_shutdown_timeout}s. "
@@ -248,17 +246,28 @@ class IssueScheduler:
             logger.info(f"Found {len(configs)} issue mirror configs due for sync")
 
             for config in configs:
-                # Spawn sync as a background task and track it
-                task = asyncio.create_task(self._sync_config_wrapper(config.id))
+                self._spawn_sync(config.id)
 
-                # Thread-safe add/remove from task set
-                def remove_task(t, lock=self._active_sync_tasks_lock, tasks=self.active_sync_tasks):
-                    with lock:
-                        tasks.discard(t)
+    def _spawn_sync(self, config_id: int) -> asyncio.Task:
+        """
+        Start syncing a config as a background task and track it until it finishes.
 
-                with self._active_sync_tasks_lock:
-                    self.active_sync_tasks.add(task)
-                task.add_done_callback(remove_task)
+        Tasks are named ``issue-sync:<config_id>`` so they are identifiable in
+        ``asyncio.all_tasks()``. The event loop only holds weak references to
+        tasks, so ``active_sync_tasks`` also keeps them alive while running.
+        """
+        task = asyncio.create_task(
+            self._sync_config_wrapper(config_id), name=f"issue-sync:{config_id}"
+        )
+        with self._active_sync_tasks_lock:
+            self.active_sync_tasks.add(task)
+        task.add_done_callback(self._forget_sync_task)
+        return task
+
+    def _forget_sync_task(self, task: asyncio.Task) -> None:
+        """Done callback: stop tracking a finished sync task (thread-safe)."""
+        with self._active_sync_tasks_lock:
+            self.active_sync_tasks.discard(task)
 
     async def _sync_config_wrapper(self, config_id: int):
         """Wrapper to sync a config with its own database session."""
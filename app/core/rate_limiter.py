@@ -8,7 +8,7 @@ with too many API requests in rapid succession.
 import asyncio
 import logging
 import threading
-from typing import Callable, TypeVar, Any
+from typing import Awaitable, Callable, TypeVar, Any
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -26,16 +26,23 @@ class RateLimiter:
     - Tracking of operation counts and timing
     """
 
-    def __init__(self, delay_ms: int = 200, max_retries: int = 3):
+    def __init__(
+        self,
+        delay_ms: int = 200,
+        max_retries: int = 3,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
         """
         Initialize rate limiter.
 
         Args:
             delay_ms: Delay in milliseconds between operations
             max_retries: Maximum number of retries on rate limit errors
+            sleep: Awaited for delays and retry backoff; tests can pass a recorder
         """
         self.delay_ms = delay_ms
         self.max_retries = max_retries
+        self._sleep = sleep
         self.operation_count = 0
         self.start_time: datetime | None = None
         self._lock = threading.Lock()
@@ -43,7 +50,7 @@ class RateLimiter:
     async def delay(self) -> None:
         """Apply configured delay between operations."""
         if self.delay_ms > 0:
-            await asyncio.sleep(self.delay_ms / 1000.0)
+            await self._sleep(self.delay_ms / 1000.0)
 
     def start_tracking(self) -> None:
         """Start tracking operations (for metrics/logging)."""
@@ -122,7 +129,7 @@ class RateLimiter:
                         f"(attempt {attempt + 1}/{self.max_retries + 1}). "
                         f"Retrying in {backoff_seconds}s..."
                     )
-                    await asyncio.sleep(backoff_seconds)
+                    await self._sleep(backoff_seconds)
                     continue
                 else:
                     # Not a rate limit error, or out of retries
@@ -155,7 +162,8 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: int = 60,
         success_threshold: int = 3,
-        expected_exception: type = Exception
+        expected_exception: type = Exception,
+        time_source: Callable[[], datetime] = datetime.utcnow
     ):
         """
         Initialize circuit breaker.
@@ -165,11 +173,13 @@ class CircuitBreaker:
             recovery_timeout: Seconds to wait before attempting recovery
             success_threshold: Number of consecutive successes needed to close circuit
             expected_exception: Exception type that triggers the circuit breaker
+            time_source: Returns the current (naive UTC) time; tests can pass a fake clock
         """
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.success_threshold = success_threshold
         self.expected_exception = expected_exception
+        self._now = time_source
 
         self.failure_count = 0
         self.success_count = 0  # Track consecutive successes in HALF_OPEN state
@@ -218,7 +228,7 @@ class CircuitBreaker:
         """Check if enough time has passed to attempt circuit reset."""
         if self.last_failure_time is None:
             return True
-        elapsed = (datetime.utcnow() - self.last_failure_time).total_seconds()
+        elapsed = (self._now() - self.last_failure_time).total_seconds()
         return elapsed >= self.recovery_timeout
 
     def _on_success(self):
@@ -243,7 +253,7 @@ class CircuitBreaker:
     def _on_failure(self):
         """Handle failed operation."""
         self.failure_count += 1
-        self.last_failure_time = datetime.utcnow()
+        self.last_failure_time = self._now()
 
         if self.state == "HALF_OPEN":
             # Failed during recovery attempt, reopen circuit
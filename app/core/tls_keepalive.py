@@ -23,6 +23,10 @@ from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
+# Module-level seam so tests can replace the openssl subprocess without
+# patching asyncio itself.
+_create_subprocess_exec = asyncio.create_subprocess_exec
+
 
 @dataclass
 class KeepAliveStatus:
@@ -274,7 +278,7 @@ class TLSKeepAliveManager:
                     f"Falling back to auto-negotiate."
                 )
 
-        proc = await asyncio.create_subprocess_exec(
+        proc = await _create_subprocess_exec(
             *cmd,
             stdin=asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.DEVNULL,
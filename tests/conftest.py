@@ -1,12 +1,22 @@
+import asyncio
+import functools
+
+import orjson
 import pytest
 
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.auth import verify_credentials
 from app.database import get_db
 from app.models import Base
 
+try:
+    import uvloop
+except ImportError:  # uvicorn[standard] pulls it in everywhere but Windows
+    uvloop = None
+
 
 class FakeEncryption:
     _prefix = "enc:"
@@ -24,36 +34,121 @@ class FakeEncryption:
         pass
 
 
-@pytest.fixture()
-async def engine(tmp_path):
-    db_file = tmp_path / "test.db"
-    eng = create_async_engine(f"sqlite+aiosqlite:///{db_file}", future=True)
+def pytest_collection_modifyitems(items):
+    """Mark every test that touches the test database as ``db`` (``-m "not db"`` skips them)."""
+    for item in items:
+        if "engine" in getattr(item, "fixturenames", ()):
+            item.add_marker(pytest.mark.db)
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run the async tests on uvloop when it is installed, like the uvicorn server does."""
+    if uvloop is not None:
+        return {"uvloop": uvloop.new_event_loop}
+    return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_key_files(tmp_path_factory):
+    """
+    Point the encryption key and JWT secret files at a per-session temp dir.
+
+    Some tests (backup restore) overwrite the key file; in ./data that would
+    leak into later runs and, under pytest-xdist, into other workers.
+    """
+    from app.config import settings
+
+    key_dir = tmp_path_factory.mktemp("keys")
+    mp = pytest.MonkeyPatch()
+    mp.setattr(settings, "encryption_key_path", str(key_dir / "encryption.key"))
+    mp.setattr(settings, "jwt_secret_key_path_env", str(key_dir / "jwt_secret.key"))
+    try:
+        yield
+    finally:
+        mp.undo()
+
+
+@pytest.fixture(scope="session")
+async def engine(tmp_path_factory):
+    """
+    Shared SQLite database for the whole test session.
+
+    The schema is created once; per-test isolation comes from ``clean_db``
+    emptying the tables instead of dropping and recreating them. All tests
+    share the session event loop (see pyproject.toml), so pooled connections
+    are reused across tests. Under pytest-xdist every worker has its own
+    basetemp and therefore its own database file.
+
+    SQLAlchemy defaults file-backed aiosqlite engines to ``NullPool``, which
+    opens a fresh connection for every session; a queue pool keeps them open
+    instead. It is sized so tests that gather concurrent requests never wait
+    on a checkout, and ``pool_pre_ping`` stays off since a local file
+    connection cannot go stale.
+    """
+    db_file = tmp_path_factory.mktemp("db") / "test.db"
+    eng = create_async_engine(
+        f"sqlite+aiosqlite:///{db_file}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=20,
+        max_overflow=10,
+        future=True,
+    )
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
     try:
         yield eng
     finally:
         await eng.dispose()
 
 
-@pytest.fixture()
-async def session_maker(engine) -> async_sessionmaker[AsyncSession]:
-    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+@pytest.fixture(scope="module")
+def encrypted_token() -> str:
+    """Real ciphertext for seeded instances, encrypted once per module rather than per row."""
+    from app.core.encryption import encryption
+
+    return encryption.encrypt("test-token")
 
 
 @pytest.fixture()
-async def db_session(engine, session_maker: async_sessionmaker[AsyncSession]):
+async def clean_db(engine):
+    """Delete all rows so each test starts from an empty database."""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
+
 
+@pytest.fixture()
+async def session_maker(engine, clean_db) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture()
+async def db_session(session_maker: async_sessionmaker[AsyncSession]):
     async with session_maker() as session:
         yield session
 
 
+@pytest.fixture(scope="session")
+def fastapi_app():
+    """
+    Import the FastAPI app and build its middleware stack once per session.
+
+    Starlette builds the middleware stack lazily on the first request; doing it
+    here keeps that one-time cost (and the app import) out of whichever test
+    happens to issue the first request.
+    """
+    from app.main import app as fastapi_app
+
+    if fastapi_app.middleware_stack is None:
+        fastapi_app.middleware_stack = fastapi_app.build_middleware_stack()
+    return fastapi_app
+
+
 @pytest.fixture()
-async def app(engine, session_maker: async_sessionmaker[AsyncSession], monkeypatch):
+async def app(session_maker: async_sessionmaker[AsyncSession], fastapi_app, monkeypatch):
     """
     FastAPI app with:
-    - DB dependency overridden to use a per-test SQLite DB
+    - DB dependency overridden to use the shared test SQLite DB (emptied per test)
     - Auth dependency overridden to bypass HTTP basic
     - Encryption swapped to a deterministic in-memory fake
     """
@@ -66,13 +161,6 @@ async def app(engine, session_maker: async_sessionmaker[AsyncSession], monkeypat
     data_dir_existed = data_dir.exists()
     key_existed = key_path.exists()
 
-    # Ensure a clean schema for each test that uses the app.
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
-
-    from app.main import app as fastapi_app
-
     fake_encryption = FakeEncryption()
 
     # Swap encryption used across modules to avoid filesystem key creation
@@ -125,13 +213,49 @@ async def app(engine, session_maker: async_sessionmaker[AsyncSession], monkeypat
             pass
 
 
-@pytest.fixture()
-async def client(app):
-    transport = ASGITransport(app=app)
+@pytest.fixture(scope="session")
+async def http_client(fastapi_app):
+    """One in-process ASGI client reused by every test in the session."""
+    transport = ASGITransport(app=fastapi_app)
     async with AsyncClient(transport=transport, base_url="http://test") as c:
         yield c
 
 
+@pytest.fixture()
+async def client(app, http_client):
+    # The client is shared, so don't let cookies leak from one test into the next.
+    http_client.cookies.clear()
+    yield http_client
+
+
+def _send_json(client: AsyncClient, method: str, url: str, payload):
+    """
+    Send a JSON payload serialized with orjson.
+
+    Equivalent to ``client.request(method, url, json=payload)`` but skips
+    httpx's stdlib ``json.dumps`` encoding, which adds up across payload-heavy
+    test modules.
+    """
+    return client.request(
+        method,
+        url,
+        content=orjson.dumps(payload),
+        headers={"content-type": "application/json"},
+    )
+
+
+@pytest.fixture()
+def post_json(client):
+    """``post_json(url, payload)``: orjson-encoded POST on the test client."""
+    return functools.partial(_send_json, client, "POST")
+
+
+@pytest.fixture()
+def put_json(client):
+    """``put_json(url, payload)``: orjson-encoded PUT on the test client."""
+    return functools.partial(_send_json, client, "PUT")
+
+
 # -----------------------------------------------------------------------------
 # E2E Test Fixtures
 # -----------------------------------------------------------------------------
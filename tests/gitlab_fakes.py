@@ -0,0 +1,55 @@
+"""
+Fake GitLab client shared by the API tests that create instances.
+
+The instance endpoints test connectivity and look up the token's user on
+create, and clean up mirrors on delete; the fake answers all of those
+without touching the network.
+"""
+
+class FakeGitLabClient:
+    test_ok = True
+    projects = [{"id": 1, "name": "p"}]
+    groups = [{"id": 2, "name": "g"}]
+    current_user = {"id": 42, "username": "mirror-bot", "name": "Mirror Bot"}
+
+    def __init__(self, url: str, encrypted_token: str, timeout: int = 60):
+        self.url = url
+        self.encrypted_token = encrypted_token
+        self.timeout = timeout
+
+    def test_connection(self) -> bool:
+        if not self.test_ok:
+            raise ConnectionError("Connection refused")
+        return True
+
+    def get_projects(self, search=None, *, per_page=50, page=1, get_all=False):
+        return self.projects
+
+    def get_groups(self, search=None, *, per_page=50, page=1, get_all=False):
+        return self.groups
+
+    def get_current_user(self):
+        return self.current_user
+
+    def delete_mirror(self, project_id: int, mirror_id: int):
+        """Mock delete_mirror (push mirror) for cleanup operations."""
+        pass
+
+    def delete_pull_mirror(self, project_id: int):
+        """Mock delete_pull_mirror for cleanup operations."""
+        pass
+
+    def delete_project_access_token(self, project_id: int, token_id: int):
+        """Mock delete_project_access_token for cleanup operations."""
+        pass
+
+
+def patch_gitlab_client(monkeypatch, client_class):
+    """Helper to patch GitLabClient in all modules that import it."""
+    import app.core.gitlab_client
+    import app.api.instances
+    import app.api.mirrors
+
+    monkeypatch.setattr(app.core.gitlab_client, "GitLabClient", client_class)
+    monkeypatch.setattr(app.api.instances, "GitLabClient", client_class)
+    monkeypatch.setattr(app.api.mirrors, "GitLabClient", client_class)
@@ -6,24 +6,23 @@ from unittest.mock import MagicMock, patch, AsyncMock
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import InstancePair, Mirror, GitLabInstance
-from app.core.encryption import encryption
 
 
 @pytest.mark.asyncio
-async def test_sync_all_mirrors_success(client: AsyncClient, db_session: AsyncSession):
+async def test_sync_all_mirrors_success(client: AsyncClient, db_session: AsyncSession, encrypted_token: str):
     """Test successful batch sync of all mirrors in a pair."""
     # Create instances
     source_instance = GitLabInstance(
         name="Source GitLab",
         url="https://source.gitlab.com",
-        encrypted_token=encryption.encrypt("source-token"),
+        encrypted_token=encrypted_token,
         api_user_id=1,
         api_username="source-user"
     )
     target_instance = GitLabInstance(
         name="Target GitLab",
         url="https://target.gitlab.com",
-        encrypted_token=encryption.encrypt("target-token"),
+        encrypted_token=encrypted_token,
         api_user_id=2,
         api_username="target-user"
     )
@@ -86,18 +85,18 @@ async def test_sync_all_mirrors_success(client: AsyncClient, db_session: AsyncSe
 
 
 @pytest.mark.asyncio
-async def test_sync_all_mirrors_no_enabled_mirrors(client: AsyncClient, db_session: AsyncSession):
+async def test_sync_all_mirrors_no_enabled_mirrors(client: AsyncClient, db_session: AsyncSession, encrypted_token: str):
     """Test batch sync when there are no enabled mirrors."""
     # Create instances
     source_instance = GitLabInstance(
         name="Source GitLab",
         url="https://source.gitlab.com",
-        encrypted_token=encryption.encrypt("source-token")
+        encrypted_token=encrypted_token
     )
     target_instance = GitLabInstance(
         name="Target GitLab",
         url="https://target.gitlab.com",
-        encrypted_token=encryption.encrypt("target-token")
+        encrypted_token=encrypted_token
     )
     db_session.add(source_instance)
     db_session.add(target_instance)
@@ -205,18 +204,18 @@ async def test_sync_all_mirrors_skip_unconfigured(client: AsyncClient, db_sessio
 
 
 @pytest.mark.asyncio
-async def test_sync_all_mirrors_partial_failure(client: AsyncClient, db_session: AsyncSession):
+async def test_sync_all_mirrors_partial_failure(client: AsyncClient, db_session: AsyncSession, encrypted_token: str):
     """Test batch sync with some mirrors failing."""
     # Create instances
     source_instance = GitLabInstance(
         name="Source GitLab",
         url="https://source.gitlab.com",
-        encrypted_token=encryption.encrypt("source-token")
+        encrypted_token=encrypted_token
     )
     target_instance = GitLabInstance(
         name="Target GitLab",
         url="https://target.gitlab.com",
-        encrypted_token=encryption.encrypt("target-token")
+        encrypted_token=encrypted_token
     )
     db_session.add(source_instance)
     db_session.add(target_instance)
@@ -289,18 +288,18 @@ async def test_sync_all_mirrors_pair_not_found(client: AsyncClient):
 
 
 @pytest.mark.asyncio
-async def test_sync_all_mirrors_pull_direction(client: AsyncClient, db_session: AsyncSession):
+async def test_sync_all_mirrors_pull_direction(client: AsyncClient, db_session: AsyncSession, encrypted_token: str):
     """Test batch sync with pull mirrors (uses target instance)."""
     # Create instances
     source_instance = GitLabInstance(
         name="Source GitLab",
         url="https://source.gitlab.com",
-        encrypted_token=encryption.encrypt("source-token")
+        encrypted_token=encrypted_token
     )
     target_instance = GitLabInstance(
         name="Target GitLab",
         url="https://target.gitlab.com",
-        encrypted_token=encryption.encrypt("target-token")
+        encrypted_token=encrypted_token
     )
     db_session.add(source_instance)
     db_session.add(target_instance)
@@ -32,6 +32,19 @@ class FakeGitLabClient:
         return self.current_user
 
 
+@pytest.fixture(autouse=True)
+def _per_test_key_file(tmp_path, monkeypatch):
+    """
+    Restores overwrite the encryption key file with the archived (fake) key.
+
+    Give each test its own key path so that never reaches the session key
+    file that the real ``encryption`` singleton in other modules reads.
+    """
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "encryption_key_path", str(tmp_path / "keys" / "encryption.key"))
+
+
 @pytest.mark.asyncio
 async def test_backup_stats_empty(client):
     """Test backup stats with empty database."""
@@ -0,0 +1,167 @@
+"""Tests for the circuit breaker state machine.
+
+Kept apart from the DB-backed robustness tests: these are pure CPU and run
+in milliseconds, so xdist can schedule them independently.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+from app.core.rate_limiter import CircuitBreaker
+from app.core.gitlab_client import GitLabClientError
+
+
+class FakeClock:
+    """Manually advanced clock for ``CircuitBreaker(time_source=...)``."""
+
+    def __init__(self):
+        self.now = datetime(2024, 1, 1)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += timedelta(seconds=seconds)
+
+
+def _cb_call_ok(breaker, _):
+    assert breaker.call(lambda: "success") == "success"
+
+
+def _cb_call_fail(breaker, _):
+    def failing_func():
+        raise Exception("Service unavailable")
+
+    with pytest.raises(Exception, match="Service unavailable"):
+        breaker.call(failing_func)
+
+
+def _cb_call_blocked(breaker, _):
+    # The call must be rejected without executing the function
+    func = Mock()
+    with pytest.raises(Exception, match="Circuit breaker is OPEN"):
+        breaker.call(func)
+    func.assert_not_called()
+
+
+def _cb_expect(breaker, attrs):
+    for name, value in attrs.items():
+        assert getattr(breaker, name) == value, name
+
+
+CB_STEPS = {
+    "ok": _cb_call_ok,
+    "fail": _cb_call_fail,
+    "blocked": _cb_call_blocked,
+    "expect": _cb_expect,
+}
+
+# (failure_threshold, recovery_timeout, success_threshold, steps, expected_state, expected_failure_count)
+# A step is a CB_STEPS key with an optional argument, or ("advance", seconds) to move the fake clock.
+CB_CASES = [
+    pytest.param(3, 5, 3, ["ok"], "CLOSED", 0, id="closed_state"),
+    pytest.param(3, 5, 3, ["fail"] * 3, "OPEN", 3, id="opens_after_failures"),
+    pytest.param(3, 5, 3, ["fail"], "CLOSED", 1, id="below_threshold_stays_closed"),
+    pytest.param(2, 60, 3, ["fail", "fail", "blocked"], "OPEN", 2, id="blocks_when_open"),
+    pytest.param(
+        2, 1, 3,
+        [
+            "fail", "fail", ("expect", {"state": "OPEN"}),
+            ("advance", 2),
+            # Gradual recovery: each success in HALF_OPEN counts toward success_threshold
+            "ok", ("expect", {"state": "HALF_OPEN", "success_count": 1}),
+            "ok", ("expect", {"state": "HALF_OPEN", "success_count": 2}),
+            "ok",
+        ],
+        "CLOSED", 0,
+        id="half_open_recovery",
+    ),
+    pytest.param(
+        2, 1, 3,
+        ["fail", "fail", ("advance", 2), "fail"],
+        "OPEN", 3,
+        id="half_open_to_open",
+    ),
+    pytest.param(
+        3, 5, 3,
+        ["fail", ("expect", {"failure_count": 1}), "ok"],
+        "CLOSED", 0,
+        id="resets_count_on_success",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "failure_threshold, recovery_timeout, success_threshold, steps, expected_state, expected_failure_count",
+    CB_CASES,
+)
+def test_circuit_breaker_state_machine(
+    failure_threshold, recovery_timeout, success_threshold, steps,
+    expected_state, expected_failure_count,
+):
+    """Test CLOSED → OPEN → HALF_OPEN → CLOSED/OPEN transitions driven by a call sequence."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        failure_threshold=failure_threshold,
+        recovery_timeout=recovery_timeout,
+        success_threshold=success_threshold,
+        time_source=clock,
+    )
+
+    for step in steps:
+        name, arg = (step, None) if isinstance(step, str) else step
+        if name == "advance":
+            clock.advance(arg)
+        else:
+            CB_STEPS[name](breaker, arg)
+
+    assert breaker.state == expected_state
+    assert breaker.failure_count == expected_failure_count
+
+
+def test_circuit_breaker_get_state():
+    """Test circuit breaker state reporting."""
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
+
+    state = breaker.get_state()
+    assert state["state"] == "CLOSED"
+    assert state["failure_count"] == 0
+    assert state["recovery_timeout"] == 60
+    assert state["last_failure_time"] is None
+
+    # Trigger a failure
+    def failing():
+        raise Exception("Failed")
+
+    with pytest.raises(Exception):
+        breaker.call(failing)
+
+    state = breaker.get_state()
+    assert state["failure_count"] == 1
+    assert state["last_failure_time"] is not None
+
+
+def test_circuit_breaker_specific_exception_type():
+    """Test circuit breaker only triggers on specific exception type."""
+    breaker = CircuitBreaker(
+        failure_threshold=2,
+        recovery_timeout=5,
+        expected_exception=GitLabClientError
+    )
+
+    def gitlab_error():
+        raise GitLabClientError("GitLab error")
+
+    def other_error():
+        raise ValueError("Different error")
+
+    # GitLab errors should trigger breaker
+    with pytest.raises(GitLabClientError):
+        breaker.call(gitlab_error)
+    assert breaker.failure_count == 1
+
+    # Other errors should not trigger breaker
+    with pytest.raises(ValueError):
+        breaker.call(other_error)
+    assert breaker.failure_count == 1  # Should not increment
@@ -5,6 +5,14 @@ import pytest
 from cryptography.fernet import Fernet
 
 
+@pytest.fixture(autouse=True)
+def _default_key_path(monkeypatch):
+    """These tests chdir into tmp_path and rely on the default relative key path."""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "encryption_key_path", "./data/encryption.key")
+
+
 def test_encryption_creates_key_and_round_trips(tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
@@ -11,7 +11,6 @@ async def seed_instance(session_maker, *, name: str) -> int:
         inst = GitLabInstance(name=name, url="https://x", encrypted_token="enc:t", description="")
         s.add(inst)
         await s.commit()
-        await s.refresh(inst)
         return inst.id
 
 
@@ -20,7 +19,6 @@ async def seed_pair(session_maker, *, name: str, src_id: int, tgt_id: int) -> in
         pair = InstancePair(name=name, source_instance_id=src_id, target_instance_id=tgt_id)
         s.add(pair)
         await s.commit()
-        await s.refresh(pair)
         return pair.id
 
 
@@ -54,7 +52,6 @@ async def seed_mirror(
         )
         s.add(m)
         await s.commit()
-        await s.refresh(m)
         return m.id
 
 
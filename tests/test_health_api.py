@@ -5,7 +5,33 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from app.models import GitLabInstance, InstancePair, Mirror
-from app.core.encryption import encryption
+
+
+@pytest.fixture()
+async def instance(db_session, encrypted_token) -> GitLabInstance:
+    """One GitLab instance, flushed but not committed; the test commits once with its own rows."""
+    instance = GitLabInstance(
+        name="Test Instance",
+        url="https://gitlab.example.com",
+        encrypted_token=encrypted_token
+    )
+    db_session.add(instance)
+    await db_session.flush()
+    return instance
+
+
+@pytest.fixture()
+async def pair(db_session, instance) -> InstancePair:
+    """A push pair mirroring ``instance`` onto itself, flushed but not committed."""
+    pair = InstancePair(
+        name="Test Pair",
+        source_instance_id=instance.id,
+        target_instance_id=instance.id,
+        mirror_direction="push"
+    )
+    db_session.add(pair)
+    await db_session.flush()
+    return pair
 
 
 @pytest.mark.asyncio
@@ -65,26 +91,8 @@ async def test_detailed_health_empty_database(client):
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_with_healthy_mirrors(client, db_session, monkeypatch):
+async def test_detailed_health_with_healthy_mirrors(client, db_session, pair):
     """Test health check with all healthy mirrors."""
-    # Create instance and pair
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
     # Create healthy mirrors
     for i in range(3):
         mirror = Mirror(
@@ -112,26 +120,8 @@ async def test_detailed_health_with_healthy_mirrors(client, db_session, monkeypa
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_with_failed_mirrors(client, db_session, monkeypatch):
+async def test_detailed_health_with_failed_mirrors(client, db_session, pair):
     """Test health check with some failed mirrors."""
-    # Create instance and pair
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
     # Create mix of successful and failed mirrors
     for i in range(4):
         mirror = Mirror(
@@ -159,26 +149,8 @@ async def test_detailed_health_with_failed_mirrors(client, db_session, monkeypat
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_unhealthy_when_most_mirrors_fail(client, db_session, monkeypatch):
+async def test_detailed_health_unhealthy_when_most_mirrors_fail(client, db_session, pair):
     """Test health check is unhealthy when most mirrors fail."""
-    # Create instance and pair
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
     # Create mostly failed mirrors (< 50% health)
     for i in range(4):
         mirror = Mirror(
@@ -203,26 +175,8 @@ async def test_detailed_health_unhealthy_when_most_mirrors_fail(client, db_sessi
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_with_disabled_mirrors(client, db_session, monkeypatch):
+async def test_detailed_health_with_disabled_mirrors(client, db_session, pair):
     """Test health check properly counts disabled mirrors."""
-    # Create instance and pair
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
     # Create mix of enabled and disabled mirrors
     for i in range(4):
         mirror = Mirror(
@@ -247,26 +201,8 @@ async def test_detailed_health_with_disabled_mirrors(client, db_session, monkeyp
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_with_expiring_tokens(client, db_session, monkeypatch):
+async def test_detailed_health_with_expiring_tokens(client, db_session, encrypted_token, pair):
     """Test health check detects tokens expiring soon."""
-    # Create instance and pair
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
     # Create mirror with token expiring in 15 days (within 30 day warning)
     mirror = Mirror(
         instance_pair_id=pair.id,
@@ -276,7 +212,7 @@ async def test_detailed_health_with_expiring_tokens(client, db_session, monkeypa
         target_project_path="group/project-mirror",
         enabled=True,
         last_update_status="success",
-        encrypted_mirror_token=encryption.encrypt("token"),
+        encrypted_mirror_token=encrypted_token,
         mirror_token_expires_at=datetime.utcnow() + timedelta(days=15)
     )
     db_session.add(mirror)
@@ -298,26 +234,8 @@ async def test_detailed_health_with_expiring_tokens(client, db_session, monkeypa
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_with_expired_tokens(client, db_session, monkeypatch):
+async def test_detailed_health_with_expired_tokens(client, db_session, encrypted_token, pair):
     """Test health check detects expired tokens."""
-    # Create instance and pair
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
     # Create mirror with expired token
     mirror = Mirror(
         instance_pair_id=pair.id,
@@ -327,7 +245,7 @@ async def test_detailed_health_with_expired_tokens(client, db_session, monkeypat
         target_project_path="group/project-mirror",
         enabled=True,
         last_update_status="success",
-        encrypted_mirror_token=encryption.encrypt("token"),
+        encrypted_mirror_token=encrypted_token,
         mirror_token_expires_at=datetime.utcnow() - timedelta(days=5)
     )
     db_session.add(mirror)
@@ -349,26 +267,8 @@ async def test_detailed_health_with_expired_tokens(client, db_session, monkeypat
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_with_active_tokens(client, db_session, monkeypatch):
+async def test_detailed_health_with_active_tokens(client, db_session, encrypted_token, pair):
     """Test health check with active tokens (not expiring soon)."""
-    # Create instance and pair
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
     # Create mirror with token expiring in 60 days (well beyond 30 day warning)
     mirror = Mirror(
         instance_pair_id=pair.id,
@@ -378,7 +278,7 @@ async def test_detailed_health_with_active_tokens(client, db_session, monkeypatc
         target_project_path="group/project-mirror",
         enabled=True,
         last_update_status="success",
-        encrypted_mirror_token=encryption.encrypt("token"),
+        encrypted_mirror_token=encrypted_token,
         mirror_token_expires_at=datetime.utcnow() + timedelta(days=60)
     )
     db_session.add(mirror)
@@ -396,16 +296,9 @@ async def test_detailed_health_with_active_tokens(client, db_session, monkeypatc
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_with_instance_check(client, db_session, monkeypatch):
+async def test_detailed_health_with_instance_check(client, db_session, instance):
     """Test health check with instance connectivity check."""
-    # Create instance
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
+    await db_session.commit()  # Make the seeded instance visible to the API
 
     # Mock GitLabClient to return successful connection
     with patch('app.api.health.GitLabClient') as MockClient:
@@ -433,16 +326,9 @@ async def test_detailed_health_with_instance_check(client, db_session, monkeypat
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_with_unreachable_instance(client, db_session, monkeypatch):
+async def test_detailed_health_with_unreachable_instance(client, db_session, instance):
     """Test health check when GitLab instance is unreachable."""
-    # Create instance
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
+    await db_session.commit()  # Make the seeded instance visible to the API
 
     # Mock GitLabClient to raise connection error
     with patch('app.api.health.GitLabClient') as MockClient:
@@ -462,16 +348,9 @@ async def test_detailed_health_with_unreachable_instance(client, db_session, mon
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_with_auth_failed_instance(client, db_session, monkeypatch):
+async def test_detailed_health_with_auth_failed_instance(client, db_session, instance):
     """Test health check when GitLab instance auth fails."""
-    # Create instance
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
+    await db_session.commit()  # Make the seeded instance visible to the API
 
     # Mock GitLabClient to raise auth error
     with patch('app.api.health.GitLabClient') as MockClient:
@@ -488,16 +367,9 @@ async def test_detailed_health_with_auth_failed_instance(client, db_session, mon
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_without_instance_check(client, db_session, monkeypatch):
+async def test_detailed_health_without_instance_check(client, db_session, instance):
     """Test health check without instance connectivity check (default)."""
-    # Create instance
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
+    await db_session.commit()  # Make the seeded instance visible to the API
 
     response = await client.get("/api/health")
     assert response.status_code == 200
@@ -515,26 +387,8 @@ async def test_detailed_health_without_instance_check(client, db_session, monkey
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_pending_mirrors(client, db_session, monkeypatch):
+async def test_detailed_health_pending_mirrors(client, db_session, pair):
     """Test health check with pending mirrors."""
-    # Create instance and pair
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
     # Create pending mirror
     mirror = Mirror(
         instance_pair_id=pair.id,
@@ -559,26 +413,8 @@ async def test_detailed_health_pending_mirrors(client, db_session, monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_detailed_health_unknown_status_mirrors(client, db_session, monkeypatch):
+async def test_detailed_health_unknown_status_mirrors(client, db_session, pair):
     """Test health check with mirrors that have unknown status (null)."""
-    # Create instance and pair
-    instance = GitLabInstance(
-        name="Test Instance",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
     # Create mirror with no status yet (null)
     mirror = Mirror(
         instance_pair_id=pair.id,
@@ -2,55 +2,12 @@ import pytest
 from sqlalchemy import select
 
 from app.models import GitLabInstance, InstancePair, Mirror
+from tests.gitlab_fakes import FakeGitLabClient, patch_gitlab_client
 
 
-class FakeGitLabClient:
-    test_ok = True
-    projects = [{"id": 1, "name": "p"}]
-    groups = [{"id": 2, "name": "g"}]
-    current_user = {"id": 42, "username": "mirror-bot", "name": "Mirror Bot"}
-
-    def __init__(self, url: str, encrypted_token: str, timeout: int = 60):
-        self.url = url
-        self.encrypted_token = encrypted_token
-        self.timeout = timeout
-
-    def test_connection(self) -> bool:
-        if not self.test_ok:
-            raise ConnectionError("Connection refused")
-        return True
-
-    def get_projects(self, search=None, *, per_page=50, page=1, get_all=False):
-        return self.projects
-
-    def get_groups(self, search=None, *, per_page=50, page=1, get_all=False):
-        return self.groups
-
-    def get_current_user(self):
-        return self.current_user
-
-    def delete_mirror(self, project_id: int, mirror_id: int):
-        """Mock delete_mirror (push mirror) for cleanup operations."""
-        pass
-
-    def delete_pull_mirror(self, project_id: int):
-        """Mock delete_pull_mirror for cleanup operations."""
-        pass
-
-    def delete_project_access_token(self, project_id: int, token_id: int):
-        """Mock delete_project_access_token for cleanup operations."""
-        pass
-
-
-def patch_gitlab_client(monkeypatch, client_class):
-    """Helper to patch GitLabClient in all modules that import it."""
-    import app.core.gitlab_client
-    import app.api.instances
-    import app.api.mirrors
-
-    monkeypatch.setattr(app.core.gitlab_client, "GitLabClient", client_class)
-    monkeypatch.setattr(app.api.instances, "GitLabClient", client_class)
-    monkeypatch.setattr(app.api.mirrors, "GitLabClient", client_class)
+def instance_payload(**overrides) -> dict:
+    """Request body for ``POST /api/instances``; ``overrides`` replace the defaults."""
+    return {"name": "inst1", "url": "https://x", "token": "t1", "description": ""} | overrides
 
 
 @pytest.mark.asyncio
@@ -61,7 +18,7 @@ async def test_instances_list_empty(client):
 
 
 @pytest.mark.asyncio
-async def test_instances_create_and_get_and_delete(client, session_maker, monkeypatch):
+async def test_instances_create_and_get_and_delete(client, post_json, session_maker, monkeypatch):
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
 
@@ -71,7 +28,7 @@ async def test_instances_create_and_get_and_delete(client, session_maker, monkey
         "token": "t1",
         "description": "d",
     }
-    resp = await client.post("/api/instances", json=payload)
+    resp = await post_json("/api/instances", payload)
     assert resp.status_code == 201
     created = resp.json()
     assert created["name"] == "inst1"
@@ -79,7 +36,7 @@ async def test_instances_create_and_get_and_delete(client, session_maker, monkey
 
     # Token should be stored encrypted in DB (fixture swaps encryption to FakeEncryption)
     async with session_maker() as s:
-        row = (await s.execute(select(GitLabInstance).where(GitLabInstance.id == created["id"]))).scalar_one()
+        row = await s.get_one(GitLabInstance, created["id"])
         assert row.encrypted_token == "enc:t1"
 
     resp = await client.get(f"/api/instances/{created['id']}")
@@ -92,7 +49,7 @@ async def test_instances_create_and_get_and_delete(client, session_maker, monkey
 
 
 @pytest.mark.asyncio
-async def test_instances_delete_cascades_pairs_mirrors_group_settings_and_tokens(client, session_maker, monkeypatch):
+async def test_instances_delete_cascades_pairs_mirrors_group_settings_and_tokens(client, post_json, session_maker, monkeypatch):
     """
     Deleting a GitLab instance should also delete any associated instance pairs and mirrors
     (and related group defaults), plus group access tokens for that instance.
@@ -102,24 +59,24 @@ async def test_instances_delete_cascades_pairs_mirrors_group_settings_and_tokens
     FakeGitLabClient.test_ok = True
 
     # Create two instances via API (exercises encryption swap + token user fetch best-effort).
-    resp = await client.post(
+    resp = await post_json(
         "/api/instances",
-        json={"name": "inst-src", "url": "https://src.example.com", "token": "t-src", "description": ""},
+        instance_payload(name="inst-src", url="https://src.example.com", token="t-src"),
     )
     assert resp.status_code == 201, resp.text
     src_id = resp.json()["id"]
 
-    resp = await client.post(
+    resp = await post_json(
         "/api/instances",
-        json={"name": "inst-tgt", "url": "https://tgt.example.com", "token": "t-tgt", "description": ""},
+        instance_payload(name="inst-tgt", url="https://tgt.example.com", token="t-tgt"),
     )
     assert resp.status_code == 201, resp.text
     tgt_id = resp.json()["id"]
 
     # Pair references src_id (will be deleted when deleting src instance).
-    resp = await client.post(
+    resp = await post_json(
         "/api/pairs",
-        json={
+        {
             "name": "pair-for-instance-delete",
             "source_instance_id": src_id,
             "target_instance_id": tgt_id,
@@ -151,12 +108,12 @@ async def test_instances_delete_cascades_pairs_mirrors_group_settings_and_tokens
     assert resp.json() == {"status": "deleted"}
 
     async with session_maker() as s:
-        inst_src = (await s.execute(select(GitLabInstance).where(GitLabInstance.id == src_id))).scalar_one_or_none()
-        inst_tgt = (await s.execute(select(GitLabInstance).where(GitLabInstance.id == tgt_id))).scalar_one_or_none()
+        inst_src = await s.get(GitLabInstance, src_id)
+        inst_tgt = await s.get(GitLabInstance, tgt_id)
         assert inst_src is None
         assert inst_tgt is not None
 
-        pair = (await s.execute(select(InstancePair).where(InstancePair.id == pair_id))).scalar_one_or_none()
+        pair = await s.get(InstancePair, pair_id)
         assert pair is None
 
         mirrors = (await s.execute(select(Mirror).where(Mirror.instance_pair_id == pair_id))).scalars().all()
@@ -164,48 +121,39 @@ async def test_instances_delete_cascades_pairs_mirrors_group_settings_and_tokens
 
 
 @pytest.mark.asyncio
-async def test_instances_create_rejects_bad_connection(client, monkeypatch):
+async def test_instances_create_rejects_bad_connection(post_json, monkeypatch):
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = False
 
-    resp = await client.post(
-        "/api/instances",
-        json={"name": "inst1", "url": "https://x", "token": "t", "description": ""},
-    )
+    resp = await post_json("/api/instances", instance_payload(token="t"))
     assert resp.status_code == 400
 
 
 @pytest.mark.asyncio
-async def test_instances_update_token(client, session_maker, monkeypatch):
+async def test_instances_update_token(post_json, put_json, session_maker, monkeypatch):
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
 
-    resp = await client.post(
-        "/api/instances",
-        json={"name": "inst1", "url": "https://x", "token": "t1", "description": ""},
-    )
+    resp = await post_json("/api/instances", instance_payload())
     assert resp.status_code == 201
     instance_id = resp.json()["id"]
 
-    resp = await client.put(f"/api/instances/{instance_id}", json={"token": "t2"})
+    resp = await put_json(f"/api/instances/{instance_id}", {"token": "t2"})
     assert resp.status_code == 200
 
     async with session_maker() as s:
-        row = (await s.execute(select(GitLabInstance).where(GitLabInstance.id == instance_id))).scalar_one()
+        row = await s.get_one(GitLabInstance, instance_id)
         assert row.encrypted_token == "enc:t2"
 
 
 @pytest.mark.asyncio
-async def test_instances_projects_and_groups(client, session_maker, monkeypatch):
+async def test_instances_projects_and_groups(client, post_json, session_maker, monkeypatch):
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
     FakeGitLabClient.projects = [{"id": 123, "name": "proj"}]
     FakeGitLabClient.groups = [{"id": 456, "name": "grp"}]
 
-    resp = await client.post(
-        "/api/instances",
-        json={"name": "inst1", "url": "https://x", "token": "t1", "description": ""},
-    )
+    resp = await post_json("/api/instances", instance_payload())
     assert resp.status_code == 201
     instance_id = resp.json()["id"]
 
@@ -219,82 +167,63 @@ async def test_instances_projects_and_groups(client, session_maker, monkeypatch)
 
 
 @pytest.mark.asyncio
-async def test_instances_update_url_disallowed_when_used_by_pair(client, session_maker, monkeypatch):
+async def test_instances_update_url_disallowed_when_used_by_pair(post_json, put_json, session_maker, monkeypatch):
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
 
-    resp = await client.post(
+    resp = await post_json(
         "/api/instances",
-        json={"name": "inst-src", "url": "https://src.example.com", "token": "t-src", "description": ""},
+        instance_payload(name="inst-src", url="https://src.example.com", token="t-src"),
     )
     assert resp.status_code == 201, resp.text
     src_id = resp.json()["id"]
 
-    resp = await client.post(
+    resp = await post_json(
         "/api/instances",
-        json={"name": "inst-tgt", "url": "https://tgt.example.com", "token": "t-tgt", "description": ""},
+        instance_payload(name="inst-tgt", url="https://tgt.example.com", token="t-tgt"),
     )
     assert resp.status_code == 201, resp.text
     tgt_id = resp.json()["id"]
 
-    resp = await client.post(
+    resp = await post_json(
         "/api/pairs",
-        json={"name": "pair-url-lock", "source_instance_id": src_id, "target_instance_id": tgt_id, "mirror_direction": "pull"},
+        {"name": "pair-url-lock", "source_instance_id": src_id, "target_instance_id": tgt_id, "mirror_direction": "pull"},
     )
     assert resp.status_code == 201, resp.text
 
-    resp = await client.put(f"/api/instances/{src_id}", json={"url": "https://new.example.com"})
+    resp = await put_json(f"/api/instances/{src_id}", {"url": "https://new.example.com"})
     assert resp.status_code == 400
     assert "cannot be changed" in resp.json()["detail"].lower()
 
 
 @pytest.mark.asyncio
-async def test_instances_get_not_found(client):
-    """Test 404 when getting non-existent instance."""
-    resp = await client.get("/api/instances/9999")
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_instances_update_not_found(client):
-    """Test 404 when updating non-existent instance."""
-    resp = await client.put("/api/instances/9999", json={"description": "test"})
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_instances_delete_not_found(client):
-    """Test 404 when deleting non-existent instance."""
-    resp = await client.delete("/api/instances/9999")
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_instances_projects_not_found(client):
-    """Test 404 when getting projects for non-existent instance."""
-    resp = await client.get("/api/instances/9999/projects")
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_instances_groups_not_found(client):
-    """Test 404 when getting groups for non-existent instance."""
-    resp = await client.get("/api/instances/9999/groups")
+@pytest.mark.parametrize(
+    "method,path",
+    [
+        ("GET", "/api/instances/9999"),
+        ("PUT", "/api/instances/9999"),
+        ("DELETE", "/api/instances/9999"),
+        ("GET", "/api/instances/9999/projects"),
+        ("GET", "/api/instances/9999/groups"),
+    ],
+)
+async def test_instances_not_found(client, method, path):
+    """Test 404 for every per-instance endpoint when the instance does not exist."""
+    resp = await client.request(
+        method, path, json={"description": "test"} if method == "PUT" else None
+    )
     assert resp.status_code == 404
 
 
 @pytest.mark.asyncio
-async def test_instances_projects_pagination_clamping(client, session_maker, monkeypatch):
+async def test_instances_projects_pagination_clamping(client, post_json, session_maker, monkeypatch):
     """Test that pagination parameters are validated (not clamped)."""
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
     FakeGitLabClient.projects = []
 
     # Create instance
-    resp = await client.post(
-        "/api/instances",
-        json={"name": "inst1", "url": "https://x", "token": "t1", "description": ""},
-    )
+    resp = await post_json("/api/instances", instance_payload())
     instance_id = resp.json()["id"]
 
     # Test per_page > 100 is rejected
@@ -329,7 +258,6 @@ async def test_instances_projects_gitlab_error(client, session_maker, monkeypatc
         )
         s.add(inst)
         await s.commit()
-        await s.refresh(inst)
         instance_id = inst.id
 
     resp = await client.get(f"/api/instances/{instance_id}/projects")
@@ -356,7 +284,6 @@ async def test_instances_groups_gitlab_error(client, session_maker, monkeypatch)
         )
         s.add(inst)
         await s.commit()
-        await s.refresh(inst)
         instance_id = inst.id
 
     resp = await client.get(f"/api/instances/{instance_id}/groups")
@@ -365,7 +292,7 @@ async def test_instances_groups_gitlab_error(client, session_maker, monkeypatch)
 
 
 @pytest.mark.asyncio
-async def test_instances_projects_with_search(client, session_maker, monkeypatch):
+async def test_instances_projects_with_search(client, post_json, session_maker, monkeypatch):
     """Test fetching projects with search parameter."""
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
@@ -375,10 +302,7 @@ async def test_instances_projects_with_search(client, session_maker, monkeypatch
     ]
 
     # Create instance
-    resp = await client.post(
-        "/api/instances",
-        json={"name": "inst1", "url": "https://x", "token": "t1", "description": ""},
-    )
+    resp = await post_json("/api/instances", instance_payload())
     instance_id = resp.json()["id"]
 
     resp = await client.get(f"/api/instances/{instance_id}/projects?search=match")
@@ -388,7 +312,7 @@ async def test_instances_projects_with_search(client, session_maker, monkeypatch
 
 
 @pytest.mark.asyncio
-async def test_instances_groups_with_pagination(client, session_maker, monkeypatch):
+async def test_instances_groups_with_pagination(client, post_json, session_maker, monkeypatch):
     """Test fetching groups with pagination."""
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
@@ -398,10 +322,7 @@ async def test_instances_groups_with_pagination(client, session_maker, monkeypat
     ]
 
     # Create instance
-    resp = await client.post(
-        "/api/instances",
-        json={"name": "inst1", "url": "https://x", "token": "t1", "description": ""},
-    )
+    resp = await post_json("/api/instances", instance_payload())
     instance_id = resp.json()["id"]
 
     resp = await client.get(f"/api/instances/{instance_id}/groups?page=2&per_page=10")
@@ -411,53 +332,44 @@ async def test_instances_groups_with_pagination(client, session_maker, monkeypat
 
 
 @pytest.mark.asyncio
-async def test_instances_update_description_only(client, session_maker, monkeypatch):
+async def test_instances_update_description_only(post_json, put_json, session_maker, monkeypatch):
     """Test updating only the description field."""
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
 
     # Create instance
-    resp = await client.post(
-        "/api/instances",
-        json={"name": "inst1", "url": "https://x", "token": "t1", "description": "original"},
-    )
+    resp = await post_json("/api/instances", instance_payload(description="original"))
     instance_id = resp.json()["id"]
 
     # Update only description
-    resp = await client.put(f"/api/instances/{instance_id}", json={"description": "updated"})
+    resp = await put_json(f"/api/instances/{instance_id}", {"description": "updated"})
     assert resp.status_code == 200
     assert resp.json()["description"] == "updated"
 
 
 @pytest.mark.asyncio
-async def test_instances_update_name_only(client, session_maker, monkeypatch):
+async def test_instances_update_name_only(post_json, put_json, session_maker, monkeypatch):
     """Test updating only the name field."""
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
 
     # Create instance
-    resp = await client.post(
-        "/api/instances",
-        json={"name": "inst1", "url": "https://x", "token": "t1", "description": ""},
-    )
+    resp = await post_json("/api/instances", instance_payload())
     instance_id = resp.json()["id"]
 
     # Update only name
-    resp = await client.put(f"/api/instances/{instance_id}", json={"name": "renamed"})
+    resp = await put_json(f"/api/instances/{instance_id}", {"name": "renamed"})
     assert resp.status_code == 200
     assert resp.json()["name"] == "renamed"
 
 
 @pytest.mark.asyncio
-async def test_instances_create_with_empty_description(client, monkeypatch):
+async def test_instances_create_with_empty_description(post_json, monkeypatch):
     """Test creating instance with empty description."""
     patch_gitlab_client(monkeypatch, FakeGitLabClient)
     FakeGitLabClient.test_ok = True
 
-    resp = await client.post(
-        "/api/instances",
-        json={"name": "inst1", "url": "https://x", "token": "t1", "description": ""},
-    )
+    resp = await post_json("/api/instances", instance_payload())
     assert resp.status_code == 201
     # Empty string is allowed
     assert resp.json()["description"] == ""
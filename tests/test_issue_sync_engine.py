@@ -266,6 +266,22 @@ def mock_pair():
     return pair
 
 
+@pytest.fixture
+def sync_engine(mock_config, mock_mirror, mock_instances, mock_pair):
+    """Sync engine over the standard mocks with GitLab clients patched out; ``engine.db`` is an AsyncMock."""
+    source, target = mock_instances
+
+    with patch('app.core.issue_sync.GitLabClient'):
+        yield IssueSyncEngine(
+            db=AsyncMock(),
+            config=mock_config,
+            mirror=mock_mirror,
+            source_instance=source,
+            target_instance=target,
+            instance_pair=mock_pair
+        )
+
+
 @pytest.mark.asyncio
 async def test_sync_engine_initialization(mock_config, mock_mirror, mock_instances, mock_pair):
     """Test sync engine initializes correctly."""
@@ -325,83 +341,61 @@ async def test_sync_engine_push_mirror_uses_same_direction(mock_config, mock_mir
 
 
 @pytest.mark.asyncio
-async def test_prepare_labels(mock_config, mock_mirror, mock_instances, mock_pair):
+async def test_prepare_labels(sync_engine):
     """Test label preparation with PM field conversion."""
-    source, target = mock_instances
-    db = AsyncMock()
-
-    with patch('app.core.issue_sync.GitLabClient'):
-        engine = IssueSyncEngine(
-            db=db,
-            config=mock_config,
-            mirror=mock_mirror,
-            source_instance=source,
-            target_instance=target,
-            instance_pair=mock_pair
-        )
+    engine = sync_engine
 
-        source_issue = {
-            "labels": ["bug", "priority::high"],
-            "milestone": {"title": "v1.0"},
-            "iteration": None,
-            "epic": {"iid": 42},
-            "assignees": [{"username": "alice"}]
-        }
+    source_issue = {
+        "labels": ["bug", "priority::high"],
+        "milestone": {"title": "v1.0"},
+        "iteration": None,
+        "epic": {"iid": 42},
+        "assignees": [{"username": "alice"}]
+    }
 
-        labels = engine._prepare_labels(source_issue)
+    labels = engine._prepare_labels(source_issue)
 
-        # Should include Mirrored-From label based on source URL hostname
-        assert "Mirrored-From::gitlab-source.example.com" in labels
+    # Should include Mirrored-From label based on source URL hostname
+    assert "Mirrored-From::gitlab-source.example.com" in labels
 
-        # Should include source labels
-        assert "bug" in labels
-        assert "priority::high" in labels
+    # Should include source labels
+    assert "bug" in labels
+    assert "priority::high" in labels
 
-        # Should include PM field labels
-        assert "Milestone::v1.0" in labels
-        assert "Epic::&42" in labels
-        assert "Assignee::@alice" in labels
+    # Should include PM field labels
+    assert "Milestone::v1.0" in labels
+    assert "Epic::&42" in labels
+    assert "Assignee::@alice" in labels
 
 
 @pytest.mark.asyncio
-async def test_prepare_description(mock_config, mock_mirror, mock_instances, mock_pair):
+async def test_prepare_description(sync_engine):
     """Test description preparation with footer."""
-    source, target = mock_instances
-    db = AsyncMock()
-
-    with patch('app.core.issue_sync.GitLabClient'):
-        engine = IssueSyncEngine(
-            db=db,
-            config=mock_config,
-            mirror=mock_mirror,
-            source_instance=source,
-            target_instance=target,
-            instance_pair=mock_pair
-        )
+    engine = sync_engine
 
-        source_issue = {
-            "iid": 123,
-            "description": "Original issue description",
-            "web_url": "https://gitlab-source.example.com/group/source/-/issues/123",
-            "milestone": {"title": "v1.0"},
-            "iteration": None,
-            "epic": None,
-            "assignees": []
-        }
+    source_issue = {
+        "iid": 123,
+        "description": "Original issue description",
+        "web_url": "https://gitlab-source.example.com/group/source/-/issues/123",
+        "milestone": {"title": "v1.0"},
+        "iteration": None,
+        "epic": None,
+        "assignees": []
+    }
 
-        description = engine._prepare_description(source_issue)
+    description = engine._prepare_description(source_issue)
 
-        # Should include original content
-        assert "Original issue description" in description
+    # Should include original content
+    assert "Original issue description" in description
 
-        # Should include footer marker
-        assert "<!-- MIRROR_MAESTRO_FOOTER -->" in description
+    # Should include footer marker
+    assert "<!-- MIRROR_MAESTRO_FOOTER -->" in description
 
-        # Should include source link
-        assert "group/source#123" in description
+    # Should include source link
+    assert "group/source#123" in description
 
-        # Should include milestone info
-        assert "v1.0" in description
+    # Should include milestone info
+    assert "v1.0" in description
 
 
 @pytest.mark.asyncio
@@ -418,148 +412,126 @@ async def test_seconds_to_duration():
 
 
 @pytest.mark.asyncio
-async def test_sync_engine_loop_prevention(mock_config, mock_mirror, mock_instances, mock_pair):
+async def test_sync_engine_loop_prevention(sync_engine):
     """Test that issues with Mirrored-From label pointing to target are skipped.
 
     This prevents infinite loops in bidirectional mirroring setups (A→B and B→A).
     If an issue on B has label 'Mirrored-From::instance-A', it originated from A
     and should not be synced back to A by the B→A sync.
     """
-    source, target = mock_instances
-    db = AsyncMock()
+    engine = sync_engine
 
     # Mock db.execute to return empty result for IssueMapping check
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = None
-    db.execute = AsyncMock(return_value=mock_result)
+    engine.db.execute = AsyncMock(return_value=mock_result)
+
+    # Verify the originated_from_target_label is set correctly
+    # Target instance URL is https://gitlab-target.example.com
+    assert engine.originated_from_target_label == "Mirrored-From::gitlab-target.example.com"
+
+    # Source issue that originated from target (has the target's Mirrored-From label)
+    # This simulates an issue on source that was originally mirrored from target
+    source_issue_from_target = {
+        "id": 500,
+        "iid": 50,
+        "title": "Issue that came from target",
+        "description": "This issue was synced from target to source",
+        "labels": ["bug", "Mirrored-From::gitlab-target.example.com"],  # Has target's label
+        "web_url": "https://gitlab-source.example.com/group/source/-/issues/50",
+    }
 
-    with patch('app.core.issue_sync.GitLabClient'):
-        engine = IssueSyncEngine(
-            db=db,
-            config=mock_config,
-            mirror=mock_mirror,
-            source_instance=source,
-            target_instance=target,
-            instance_pair=mock_pair
-        )
+    # Native source issue (no Mirrored-From label)
+    native_source_issue = {
+        "id": 501,
+        "iid": 51,
+        "title": "Native issue on source",
+        "description": "This issue was created natively on source",
+        "labels": ["feature"],  # No Mirrored-From label
+        "web_url": "https://gitlab-source.example.com/group/source/-/issues/51",
+    }
 
-        # Verify the originated_from_target_label is set correctly
-        # Target instance URL is https://gitlab-target.example.com
-        assert engine.originated_from_target_label == "Mirrored-From::gitlab-target.example.com"
-
-        # Source issue that originated from target (has the target's Mirrored-From label)
-        # This simulates an issue on source that was originally mirrored from target
-        source_issue_from_target = {
-            "id": 500,
-            "iid": 50,
-            "title": "Issue that came from target",
-            "description": "This issue was synced from target to source",
-            "labels": ["bug", "Mirrored-From::gitlab-target.example.com"],  # Has target's label
-            "web_url": "https://gitlab-source.example.com/group/source/-/issues/50",
-        }
-
-        # Native source issue (no Mirrored-From label)
-        native_source_issue = {
-            "id": 501,
-            "iid": 51,
-            "title": "Native issue on source",
-            "description": "This issue was created natively on source",
-            "labels": ["feature"],  # No Mirrored-From label
-            "web_url": "https://gitlab-source.example.com/group/source/-/issues/51",
-        }
-
-        stats = {
-            "issues_processed": 0,
-            "issues_created": 0,
-            "issues_updated": 0,
-            "issues_skipped": 0,
-            "issues_failed": 0,
-            "errors": [],
-        }
-
-        # Test: Issue with target's Mirrored-From label (target hostname) should be skipped
-        await engine._sync_issue(source_issue_from_target, stats)
+    stats = {
+        "issues_processed": 0,
+        "issues_created": 0,
+        "issues_updated": 0,
+        "issues_skipped": 0,
+        "issues_failed": 0,
+        "errors": [],
+    }
+
+    # Test: Issue with target's Mirrored-From label (target hostname) should be skipped
+    await engine._sync_issue(source_issue_from_target, stats)
+
+    assert stats["issues_processed"] == 1
+    assert stats["issues_skipped"] == 1
+    assert stats["issues_created"] == 0
+    # Database should NOT be queried for mapping since we skip early
+    # (The db.execute call for IssueMapping should not happen)
+
+    # Reset stats
+    stats = {
+        "issues_processed": 0,
+        "issues_created": 0,
+        "issues_updated": 0,
+        "issues_skipped": 0,
+        "issues_failed": 0,
+        "errors": [],
+    }
+
+    # Test: Native issue should proceed to mapping check
+    # We'll mock the full flow for this test
+    with patch.object(engine, '_create_target_issue', new_callable=AsyncMock) as mock_create:
+        await engine._sync_issue(native_source_issue, stats)
 
         assert stats["issues_processed"] == 1
-        assert stats["issues_skipped"] == 1
-        assert stats["issues_created"] == 0
-        # Database should NOT be queried for mapping since we skip early
-        # (The db.execute call for IssueMapping should not happen)
-
-        # Reset stats
-        stats = {
-            "issues_processed": 0,
-            "issues_created": 0,
-            "issues_updated": 0,
-            "issues_skipped": 0,
-            "issues_failed": 0,
-            "errors": [],
-        }
-
-        # Test: Native issue should proceed to mapping check
-        # We'll mock the full flow for this test
-        with patch.object(engine, '_create_target_issue', new_callable=AsyncMock) as mock_create:
-            await engine._sync_issue(native_source_issue, stats)
-
-            assert stats["issues_processed"] == 1
-            # Should proceed past loop prevention check
-            # Since no mapping exists, it should try to create
-            assert mock_create.called or stats["issues_created"] == 1 or stats["issues_skipped"] == 0
+        # Should proceed past loop prevention check
+        # Since no mapping exists, it should try to create
+        assert mock_create.called or stats["issues_created"] == 1 or stats["issues_skipped"] == 0
 
 
 @pytest.mark.asyncio
-async def test_sync_engine_loop_prevention_with_different_label(mock_config, mock_mirror, mock_instances, mock_pair):
+async def test_sync_engine_loop_prevention_with_different_label(sync_engine):
     """Test that issues with a DIFFERENT Mirrored-From label are NOT skipped.
 
     An issue with Mirrored-From::gitlab-third.example.com (a third instance) should
     still be synced, only Mirrored-From::{target_hostname} should be skipped.
     This is the key behavior that enables multi-hop syncing (A→B→C).
     """
-    source, target = mock_instances
-    db = AsyncMock()
+    engine = sync_engine
+
+    # Issue from a third instance (not source or target)
+    issue_from_third_instance = {
+        "id": 600,
+        "iid": 60,
+        "title": "Issue from third instance",
+        "description": "This came from a third GitLab",
+        "labels": ["bug", "Mirrored-From::gitlab-third.example.com"],  # Different instance
+        "web_url": "https://gitlab-source.example.com/group/source/-/issues/60",
+    }
 
-    with patch('app.core.issue_sync.GitLabClient'):
-        engine = IssueSyncEngine(
-            db=db,
-            config=mock_config,
-            mirror=mock_mirror,
-            source_instance=source,
-            target_instance=target,
-            instance_pair=mock_pair
-        )
+    stats = {
+        "issues_processed": 0,
+        "issues_created": 0,
+        "issues_updated": 0,
+        "issues_skipped": 0,
+        "issues_failed": 0,
+        "errors": [],
+    }
+
+    # Mock db.execute to return empty result (no existing mapping)
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = None
+    engine.db.execute = AsyncMock(return_value=mock_result)
+
+    with patch.object(engine, '_create_target_issue', new_callable=AsyncMock) as mock_create:
+        await engine._sync_issue(issue_from_third_instance, stats)
 
-        # Issue from a third instance (not source or target)
-        issue_from_third_instance = {
-            "id": 600,
-            "iid": 60,
-            "title": "Issue from third instance",
-            "description": "This came from a third GitLab",
-            "labels": ["bug", "Mirrored-From::gitlab-third.example.com"],  # Different instance
-            "web_url": "https://gitlab-source.example.com/group/source/-/issues/60",
-        }
-
-        stats = {
-            "issues_processed": 0,
-            "issues_created": 0,
-            "issues_updated": 0,
-            "issues_skipped": 0,
-            "issues_failed": 0,
-            "errors": [],
-        }
-
-        # Mock db.execute to return empty result (no existing mapping)
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        db.execute = AsyncMock(return_value=mock_result)
-
-        with patch.object(engine, '_create_target_issue', new_callable=AsyncMock) as mock_create:
-            await engine._sync_issue(issue_from_third_instance, stats)
-
-            # Should NOT be skipped - the label is for a different hostname
-            assert stats["issues_processed"] == 1
-            assert stats["issues_skipped"] == 0
-            # Should proceed to create since no mapping exists
-            assert mock_create.called
+        # Should NOT be skipped - the label is for a different hostname
+        assert stats["issues_processed"] == 1
+        assert stats["issues_skipped"] == 0
+        # Should proceed to create since no mapping exists
+        assert mock_create.called
 
 
 @pytest.mark.asyncio
@@ -720,26 +692,18 @@ async def test_multi_instance_label_stripping_in_prepare_labels(mock_config, moc
 
 
 @pytest.mark.asyncio
-async def test_legacy_label_backward_compatibility(mock_config, mock_mirror, mock_instances, mock_pair):
+async def test_legacy_label_backward_compatibility(sync_engine):
     """Test that old Mirrored-From::instance-{id} labels are still recognised.
 
     After upgrading from the old ID-based format to URL-based format, issues
     tagged with the legacy format must still be detected by loop prevention
     to avoid creating duplicates.
     """
-    source, target = mock_instances
-    db = AsyncMock()
+    engine = sync_engine
 
     mock_result = MagicMock()
     mock_result.scalar_one_or_none.return_value = None
-    db.execute = AsyncMock(return_value=mock_result)
-
-    with patch('app.core.issue_sync.GitLabClient'):
-        engine = IssueSyncEngine(
-            db=db, config=mock_config, mirror=mock_mirror,
-            source_instance=source, target_instance=target,
-            instance_pair=mock_pair,
-        )
+    engine.db.execute = AsyncMock(return_value=mock_result)
 
     # Verify legacy label is set (target.id = 2)
     assert engine._originated_from_target_label_legacy == "Mirrored-From::instance-2"
@@ -1,5 +1,4 @@
 import pytest
-from sqlalchemy import select
 
 from app.models import GitLabInstance, InstancePair, Mirror
 
@@ -230,7 +229,7 @@ async def test_mirrors_trigger_update_updates_status(client, session_maker, monk
     assert FakeGitLabClient.trigger_pull_calls[-1] == (2,)
 
     async with session_maker() as s:
-        m2 = (await s.execute(select(Mirror).where(Mirror.id == mirror_id))).scalar_one()
+        m2 = await s.get_one(Mirror, mirror_id)
         # After trigger, the endpoint refreshes status from GitLab.
         # GitLab 'started' maps to 'syncing' in our internal representation.
         assert m2.last_update_status == "syncing"
@@ -274,7 +273,7 @@ async def test_mirrors_delete_best_effort_gitlab_and_db(client, session_maker, m
     assert FakeGitLabClient.delete_pull_calls[-1] == (2,)
 
     async with session_maker() as s:
-        row = (await s.execute(select(Mirror).where(Mirror.id == mirror_id))).scalar_one_or_none()
+        row = await s.get(Mirror, mirror_id)
         assert row is None
 
 
@@ -293,7 +292,7 @@ async def test_mirrors_update_applies_settings_to_gitlab(client, session_maker,
 
     async with session_maker() as s:
         # Pair defaults
-        pair = (await s.execute(select(InstancePair).where(InstancePair.id == pair_id))).scalar_one()
+        pair = await s.get_one(InstancePair, pair_id)
         pair.mirror_overwrite_diverged = True
         pair.only_mirror_protected_branches = True
         pair.mirror_trigger_builds = True
@@ -404,7 +403,7 @@ async def test_mirrors_update_can_clear_overrides_with_null(client, session_make
     assert resp.json()["mirror_overwrite_diverged"] is None
 
     async with session_maker() as s:
-        row = (await s.execute(select(Mirror).where(Mirror.id == db_mirror_id))).scalar_one()
+        row = await s.get_one(Mirror, db_mirror_id)
         assert row.mirror_overwrite_diverged is None
 
 
@@ -773,7 +772,7 @@ async def test_mirrors_update_multiple_settings(client, session_maker, monkeypat
 
     # Verify DB was updated
     async with session_maker() as s:
-        row = (await s.execute(select(Mirror).where(Mirror.id == mirror_id))).scalar_one()
+        row = await s.get_one(Mirror, mirror_id)
         assert row.enabled is False
         assert row.mirror_overwrite_diverged is True
 
@@ -812,7 +811,7 @@ async def test_mirrors_update_partial_settings(client, session_maker, monkeypatc
     assert resp.status_code == 200
 
     async with session_maker() as s:
-        row = (await s.execute(select(Mirror).where(Mirror.id == mirror_id))).scalar_one()
+        row = await s.get_one(Mirror, mirror_id)
         assert row.enabled is False
         # Other settings unchanged
         assert row.mirror_overwrite_diverged is True
@@ -894,7 +893,7 @@ async def test_mirrors_delete_without_mirror_id(client, session_maker, monkeypat
 
     # But should still delete from DB
     async with session_maker() as s:
-        row = (await s.execute(select(Mirror).where(Mirror.id == mirror_id))).scalar_one_or_none()
+        row = await s.get(Mirror, mirror_id)
         assert row is None
 
 
@@ -938,7 +937,7 @@ async def test_mirrors_delete_gitlab_api_failure_still_deletes_db(client, sessio
 
     # Should still be deleted from DB
     async with session_maker() as s:
-        row = (await s.execute(select(Mirror).where(Mirror.id == mirror_id))).scalar_one_or_none()
+        row = await s.get(Mirror, mirror_id)
         assert row is None
 
 
@@ -1589,7 +1588,7 @@ async def test_trigger_update_re_enables_paused_pull_mirror(client, session_make
 
     # Local DB should now have enabled=True
     async with session_maker() as s:
-        m2 = (await s.execute(select(Mirror).where(Mirror.id == mirror_id))).scalar_one()
+        m2 = await s.get_one(Mirror, mirror_id)
         assert m2.enabled is True
 
 
@@ -1751,7 +1750,7 @@ async def test_refresh_status_syncs_enabled_field(client, session_maker, monkeyp
 
     # Local DB should now reflect the disabled state from GitLab
     async with session_maker() as s:
-        m2 = (await s.execute(select(Mirror).where(Mirror.id == mirror_id))).scalar_one()
+        m2 = await s.get_one(Mirror, mirror_id)
         assert m2.enabled is False
         assert m2.last_update_status == "failed"
         assert m2.last_error == "13:fetch remote: fatal: ..."
@@ -1,6 +1,9 @@
 import pytest
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, insert, select
 
+from app.api import mirrors as mirrors_mod
+from app.api import pairs as pairs_mod
+from app.core import gitlab_client as gitlab_client_mod
 from app.models import GitLabInstance, InstancePair, Mirror
 
 
@@ -23,42 +26,93 @@ class FakeGitLabClient:
         pass
 
 
+# Modules that import GitLabClient by name and therefore need patching.
+_PATCH_TARGETS = (gitlab_client_mod, pairs_mod, mirrors_mod)
+
+
 def patch_gitlab_client(monkeypatch, client_class):
     """Helper to patch GitLabClient in all modules that import it."""
-    import app.core.gitlab_client
-    import app.api.pairs
-    import app.api.mirrors
+    for module in _PATCH_TARGETS:
+        monkeypatch.setattr(module, "GitLabClient", client_class)
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _fake_gitlab_client():
+    """Use FakeGitLabClient for every test here so pair cleanup never reaches the network."""
+    with pytest.MonkeyPatch.context() as mp:
+        patch_gitlab_client(mp, FakeGitLabClient)
+        yield
 
-    monkeypatch.setattr(app.core.gitlab_client, "GitLabClient", client_class)
-    monkeypatch.setattr(app.api.pairs, "GitLabClient", client_class)
-    monkeypatch.setattr(app.api.mirrors, "GitLabClient", client_class)
+
+# Pair row count and mirror row count for a pair id, fetched in one round-trip.
+_REMAINING_PAIR_ROWS = select(
+    select(func.count()).select_from(InstancePair).where(InstancePair.id == bindparam("pair_id")).scalar_subquery(),
+    select(func.count()).select_from(Mirror).where(Mirror.instance_pair_id == bindparam("pair_id")).scalar_subquery(),
+)
 
 
 async def seed_instance(session_maker, *, name: str, url: str = "https://x") -> int:
     async with session_maker() as s:
-        inst = GitLabInstance(name=name, url=url, encrypted_token="enc:t", description="")
-        s.add(inst)
+        result = await s.execute(
+            insert(GitLabInstance)
+            .values(name=name, url=url, encrypted_token="enc:t")
+            .returning(GitLabInstance.id)
+        )
+        inst_id = result.scalar_one()
+        await s.commit()
+        return inst_id
+
+
+async def seed_instances(session_maker, names: list[str], url: str = "https://x") -> list[int]:
+    """Insert several instances in one statement and return their ids in order."""
+    async with session_maker() as s:
+        result = await s.execute(
+            insert(GitLabInstance).returning(GitLabInstance.id, sort_by_parameter_order=True),
+            [{"name": name, "url": url, "encrypted_token": "enc:t"} for name in names],
+        )
+        ids = list(result.scalars())
+        await s.commit()
+        return ids
+
+
+async def seed_pair(session_maker, *, name: str, src_id: int, tgt_id: int, **fields) -> int:
+    """Insert a pair straight into the DB for tests where pair creation isn't under test."""
+    async with session_maker() as s:
+        result = await s.execute(
+            insert(InstancePair)
+            .values(name=name, source_instance_id=src_id, target_instance_id=tgt_id, **fields)
+            .returning(InstancePair.id)
+        )
+        pair_id = result.scalar_one()
         await s.commit()
-        await s.refresh(inst)
-        return inst.id
+        return pair_id
+
+
+@pytest.fixture()
+async def instance_pool(session_maker) -> list[int]:
+    """Seed three instances in a single statement and return their ids."""
+    return await seed_instances(session_maker, [f"inst-{i}" for i in range(3)])
+
+
+@pytest.fixture()
+async def pair(session_maker, instance_pool):
+    """Create a pair between the first two pooled instances."""
+    src_id, tgt_id = instance_pool[:2]
+    pair_id = await seed_pair(session_maker, name="pair1", src_id=src_id, tgt_id=tgt_id)
+    return src_id, tgt_id, pair_id
 
 
 @pytest.mark.asyncio
-async def test_pairs_create_list_update_delete(client, session_maker):
-    src_id = await seed_instance(session_maker, name="src")
-    tgt_id = await seed_instance(session_maker, name="tgt")
+async def test_pairs_create_list_update_delete(client, post_json, put_json, instance_pool):
+    src_id, tgt_id = instance_pool[:2]
 
     payload = {
         "name": "pair1",
         "source_instance_id": src_id,
         "target_instance_id": tgt_id,
-        "mirror_direction": "pull",
-        "mirror_overwrite_diverged": False,
-        "mirror_trigger_builds": False,
-        "only_mirror_protected_branches": False,
         "description": "d",
     }
-    resp = await client.post("/api/pairs", json=payload)
+    resp = await post_json("/api/pairs", payload)
     assert resp.status_code == 201
     pair_id = resp.json()["id"]
 
@@ -70,7 +124,7 @@ async def test_pairs_create_list_update_delete(client, session_maker):
     assert resp.status_code == 200
     assert resp.json()["name"] == "pair1"
 
-    resp = await client.put(f"/api/pairs/{pair_id}", json={"mirror_direction": "push"})
+    resp = await put_json(f"/api/pairs/{pair_id}", {"mirror_direction": "push"})
     assert resp.status_code == 200
     assert resp.json()["mirror_direction"] == "push"
 
@@ -80,28 +134,13 @@ async def test_pairs_create_list_update_delete(client, session_maker):
 
 
 @pytest.mark.asyncio
-async def test_pairs_delete_cascades_mirrors_and_group_defaults(client, session_maker, monkeypatch):
+async def test_pairs_delete_cascades_mirrors_and_group_defaults(client, session_maker, instance_pool):
     """
     Test that deleting a pair also deletes associated mirrors from both
     the database and GitLab with proper rate limiting.
     """
-    # Patch GitLabClient so cleanup operations use mock instead of real client
-    patch_gitlab_client(monkeypatch, FakeGitLabClient)
-
-    src_id = await seed_instance(session_maker, name="src")
-    tgt_id = await seed_instance(session_maker, name="tgt")
-
-    resp = await client.post(
-        "/api/pairs",
-        json={
-            "name": "pair-cascade",
-            "source_instance_id": src_id,
-            "target_instance_id": tgt_id,
-            "mirror_direction": "pull",
-        },
-    )
-    assert resp.status_code == 201, resp.text
-    pair_id = resp.json()["id"]
+    src_id, tgt_id = instance_pool[:2]
+    pair_id = await seed_pair(session_maker, name="pair-cascade", src_id=src_id, tgt_id=tgt_id)
 
     async with session_maker() as s:
         m = Mirror(
@@ -122,41 +161,30 @@ async def test_pairs_delete_cascades_mirrors_and_group_defaults(client, session_
     assert resp.json() == {"status": "deleted"}
 
     async with session_maker() as s:
-        pair = (await s.execute(select(InstancePair).where(InstancePair.id == pair_id))).scalar_one_or_none()
-        assert pair is None
-
-        mirrors = (await s.execute(select(Mirror).where(Mirror.instance_pair_id == pair_id))).scalars().all()
-        assert mirrors == []
+        remaining = (await s.execute(_REMAINING_PAIR_ROWS, {"pair_id": pair_id})).one()
+        assert tuple(remaining) == (0, 0)
 
 
 @pytest.mark.asyncio
-async def test_pairs_create_requires_instances(client, session_maker):
-    tgt_id = await seed_instance(session_maker, name="tgt")
-
-    resp = await client.post(
-        "/api/pairs",
-        json={
-            "name": "pair1",
-            "source_instance_id": 999,
-            "target_instance_id": tgt_id,
-        },
-    )
+@pytest.mark.parametrize(
+    "missing, detail",
+    [("source", "Source instance not found"), ("target", "Target instance not found")],
+)
+async def test_pairs_create_requires_instances(post_json, session_maker, missing, detail):
+    """Test creating a pair with an unknown source or target instance."""
+    existing_id = await seed_instance(session_maker, name="existing")
+    payload = {"name": "pair1", "source_instance_id": existing_id, "target_instance_id": existing_id}
+    payload[f"{missing}_instance_id"] = 999
+
+    resp = await post_json("/api/pairs", payload)
     assert resp.status_code == 404
-    assert resp.json()["detail"] == "Source instance not found"
+    assert resp.json()["detail"] == detail
 
 
 @pytest.mark.asyncio
-async def test_pairs_cannot_change_instances_when_mirrors_exist(client, session_maker):
-    src_id = await seed_instance(session_maker, name="src")
-    tgt_id = await seed_instance(session_maker, name="tgt")
-    other_id = await seed_instance(session_maker, name="other")
-
-    resp = await client.post(
-        "/api/pairs",
-        json={"name": "pair-lock", "source_instance_id": src_id, "target_instance_id": tgt_id, "mirror_direction": "pull"},
-    )
-    assert resp.status_code == 201, resp.text
-    pair_id = resp.json()["id"]
+async def test_pairs_cannot_change_instances_when_mirrors_exist(put_json, session_maker, instance_pool, pair):
+    _, _, pair_id = pair
+    other_id = instance_pool[2]
 
     async with session_maker() as s:
         m = Mirror(
@@ -172,58 +200,29 @@ async def test_pairs_cannot_change_instances_when_mirrors_exist(client, session_
         s.add(m)
         await s.commit()
 
-    resp = await client.put(f"/api/pairs/{pair_id}", json={"source_instance_id": other_id})
+    resp = await put_json(f"/api/pairs/{pair_id}", {"source_instance_id": other_id})
     assert resp.status_code == 400
     assert "cannot change" in resp.json()["detail"].lower()
 
 
 @pytest.mark.asyncio
-async def test_pairs_get_not_found(client):
-    """Test 404 when getting non-existent pair."""
-    resp = await client.get("/api/pairs/9999")
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_pairs_update_not_found(client):
-    """Test 404 when updating non-existent pair."""
-    resp = await client.put("/api/pairs/9999", json={"name": "test"})
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_pairs_delete_not_found(client):
-    """Test 404 when deleting non-existent pair."""
-    resp = await client.delete("/api/pairs/9999")
-    assert resp.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_pairs_create_target_instance_not_found(client, session_maker):
-    """Test creating pair with invalid target instance."""
-    src_id = await seed_instance(session_maker, name="src")
-
-    resp = await client.post(
-        "/api/pairs",
-        json={
-            "name": "pair1",
-            "source_instance_id": src_id,
-            "target_instance_id": 999,
-        },
+@pytest.mark.parametrize("method", ["GET", "PUT", "DELETE"])
+async def test_pairs_not_found(client, method):
+    """Test 404 when reading, updating or deleting a non-existent pair."""
+    resp = await client.request(
+        method, "/api/pairs/9999", json={"name": "test"} if method == "PUT" else None
     )
     assert resp.status_code == 404
-    assert resp.json()["detail"] == "Target instance not found"
 
 
 @pytest.mark.asyncio
-async def test_pairs_create_with_all_settings(client, session_maker):
+async def test_pairs_create_with_all_settings(post_json, instance_pool):
     """Test creating pair with all mirror settings."""
-    src_id = await seed_instance(session_maker, name="src")
-    tgt_id = await seed_instance(session_maker, name="tgt")
+    src_id, tgt_id = instance_pool[:2]
 
-    resp = await client.post(
+    resp = await post_json(
         "/api/pairs",
-        json={
+        {
             "name": "full-pair",
             "source_instance_id": src_id,
             "target_instance_id": tgt_id,
@@ -245,27 +244,14 @@ async def test_pairs_create_with_all_settings(client, session_maker):
 
 
 @pytest.mark.asyncio
-async def test_pairs_update_multiple_fields(client, session_maker):
+async def test_pairs_update_multiple_fields(put_json, pair):
     """Test updating multiple fields at once."""
-    src_id = await seed_instance(session_maker, name="src")
-    tgt_id = await seed_instance(session_maker, name="tgt")
-
-    # Create pair
-    resp = await client.post(
-        "/api/pairs",
-        json={
-            "name": "pair1",
-            "source_instance_id": src_id,
-            "target_instance_id": tgt_id,
-            "mirror_direction": "push",
-        },
-    )
-    pair_id = resp.json()["id"]
+    _, _, pair_id = pair
 
     # Update multiple fields
-    resp = await client.put(
+    resp = await put_json(
         f"/api/pairs/{pair_id}",
-        json={
+        {
             "name": "renamed-pair",
             "description": "Updated description",
             "mirror_overwrite_diverged": True,
@@ -279,38 +265,24 @@ async def test_pairs_update_multiple_fields(client, session_maker):
 
 
 @pytest.mark.asyncio
-async def test_pairs_update_only_name(client, session_maker):
+async def test_pairs_update_only_name(put_json, pair):
     """Test updating only the name field."""
-    src_id = await seed_instance(session_maker, name="src")
-    tgt_id = await seed_instance(session_maker, name="tgt")
-
-    resp = await client.post(
-        "/api/pairs",
-        json={"name": "pair1", "source_instance_id": src_id, "target_instance_id": tgt_id},
-    )
-    pair_id = resp.json()["id"]
+    _, _, pair_id = pair
 
-    resp = await client.put(f"/api/pairs/{pair_id}", json={"name": "new-name"})
+    resp = await put_json(f"/api/pairs/{pair_id}", {"name": "new-name"})
     assert resp.status_code == 200
     assert resp.json()["name"] == "new-name"
 
 
 @pytest.mark.asyncio
-async def test_pairs_update_mirror_settings(client, session_maker):
+async def test_pairs_update_mirror_settings(put_json, pair):
     """Test updating various mirror settings."""
-    src_id = await seed_instance(session_maker, name="src")
-    tgt_id = await seed_instance(session_maker, name="tgt")
-
-    resp = await client.post(
-        "/api/pairs",
-        json={"name": "pair1", "source_instance_id": src_id, "target_instance_id": tgt_id},
-    )
-    pair_id = resp.json()["id"]
+    _, _, pair_id = pair
 
     # Update mirror settings
-    resp = await client.put(
+    resp = await put_json(
         f"/api/pairs/{pair_id}",
-        json={
+        {
             "mirror_overwrite_diverged": True,
             "mirror_trigger_builds": False,
             "mirror_branch_regex": "release/.*",
@@ -324,14 +296,13 @@ async def test_pairs_update_mirror_settings(client, session_maker):
 
 
 @pytest.mark.asyncio
-async def test_pairs_create_with_push_direction(client, session_maker):
+async def test_pairs_create_with_push_direction(post_json, instance_pool):
     """Test creating pair with push direction."""
-    src_id = await seed_instance(session_maker, name="src")
-    tgt_id = await seed_instance(session_maker, name="tgt")
+    src_id, tgt_id = instance_pool[:2]
 
-    resp = await client.post(
+    resp = await post_json(
         "/api/pairs",
-        json={
+        {
             "name": "push-pair",
             "source_instance_id": src_id,
             "target_instance_id": tgt_id,
@@ -343,19 +314,14 @@ async def test_pairs_create_with_push_direction(client, session_maker):
 
 
 @pytest.mark.asyncio
-async def test_pairs_list_returns_all_pairs(client, session_maker):
+async def test_pairs_list_returns_all_pairs(client, post_json, pair):
     """Test listing multiple pairs."""
-    src_id = await seed_instance(session_maker, name="src")
-    tgt_id = await seed_instance(session_maker, name="tgt")
+    src_id, tgt_id, _ = pair
 
-    # Create multiple pairs
-    await client.post(
-        "/api/pairs",
-        json={"name": "pair1", "source_instance_id": src_id, "target_instance_id": tgt_id},
-    )
-    await client.post(
+    # "pair1" comes from the fixture; add the reverse pair alongside it
+    await post_json(
         "/api/pairs",
-        json={"name": "pair2", "source_instance_id": tgt_id, "target_instance_id": src_id},
+        {"name": "pair2", "source_instance_id": tgt_id, "target_instance_id": src_id},
     )
 
     resp = await client.get("/api/pairs")
@@ -367,23 +333,23 @@ async def test_pairs_list_returns_all_pairs(client, session_maker):
 
 
 @pytest.mark.asyncio
-async def test_pairs_bidirectional_mirroring(client, session_maker):
+@pytest.mark.parametrize("via", ["create", "update"])
+async def test_pairs_bidirectional_mirroring(client, post_json, put_json, instance_pool, via):
     """
-    Test bidirectional mirroring by creating pairs in both directions.
+    Test bidirectional mirroring between two instances (A→B and B→A).
 
-    This validates that:
-    1. Two pairs can be created between the same instances (A→B and B→A)
-    2. Each pair can have different settings
-    3. Both pairs can be retrieved and have correct source/target
-    4. Creating the reverse pair returns a warning about bidirectional mirroring
+    The reverse B→A pair is either created directly or produced by updating an
+    unrelated C→A pair. Either way:
+    1. Both pairs coexist with their own settings and correct source/target
+    2. The first pair gets no warning
+    3. The reverse pair comes back with a bidirectional mirroring warning
     """
-    instance_a = await seed_instance(session_maker, name="Instance A", url="https://gitlab-a.example.com")
-    instance_b = await seed_instance(session_maker, name="Instance B", url="https://gitlab-b.example.com")
+    instance_a, instance_b, instance_c = instance_pool
 
     # Create A → B pair (push to backup) - no warning expected (first pair)
-    resp_ab = await client.post(
+    resp_ab = await post_json(
         "/api/pairs",
-        json={
+        {
             "name": "A to B (outbound)",
             "source_instance_id": instance_a,
             "target_instance_id": instance_b,
@@ -401,19 +367,43 @@ async def test_pairs_bidirectional_mirroring(client, session_maker):
     assert pair_ab.get("warnings") is None  # No warning for first pair
     assert pair_ab.get("reverse_pair_id") is None
 
-    # Create B → A pair (pull from backup) - warning expected (reverse pair exists)
-    resp_ba = await client.post(
-        "/api/pairs",
-        json={
-            "name": "B to A (inbound)",
-            "source_instance_id": instance_b,
-            "target_instance_id": instance_a,
-            "mirror_direction": "pull",
-            "mirror_overwrite_diverged": False,
-            "description": "Pull changes from B to A",
-        },
-    )
-    assert resp_ba.status_code == 201
+    # B → A pair (pull from backup) - warning expected (reverse pair exists)
+    reverse_settings = {
+        "mirror_direction": "pull",
+        "mirror_overwrite_diverged": False,
+        "description": "Pull changes from B to A",
+    }
+    if via == "create":
+        resp_ba = await post_json(
+            "/api/pairs",
+            {
+                "name": "B to A (inbound)",
+                "source_instance_id": instance_b,
+                "target_instance_id": instance_a,
+                **reverse_settings,
+            },
+        )
+        assert resp_ba.status_code == 201
+    else:
+        resp_ca = await post_json(
+            "/api/pairs",
+            {
+                "name": "C to A",
+                "source_instance_id": instance_c,
+                "target_instance_id": instance_a,
+                **reverse_settings,
+            },
+        )
+        assert resp_ca.status_code == 201
+        assert resp_ca.json().get("warnings") is None  # No warning (not a reverse)
+
+        # Update C→A to become B→A (reverse of A→B)
+        resp_ba = await put_json(
+            f"/api/pairs/{resp_ca.json()['id']}",
+            {"source_instance_id": instance_b, "name": "B to A (inbound)"},
+        )
+        assert resp_ba.status_code == 200
+
     pair_ba = resp_ba.json()
     assert pair_ba["source_instance_id"] == instance_b
     assert pair_ba["target_instance_id"] == instance_a
@@ -442,40 +432,22 @@ async def test_pairs_bidirectional_mirroring(client, session_maker):
 
 
 @pytest.mark.asyncio
-async def test_pairs_bidirectional_with_mirrors(client, session_maker):
+async def test_pairs_bidirectional_with_mirrors(client, session_maker, instance_pool):
     """
     Test bidirectional mirroring with actual mirrors in each direction.
 
     This validates that mirrors can be created on pairs going both directions
     between the same two instances.
     """
-    instance_a = await seed_instance(session_maker, name="Instance A")
-    instance_b = await seed_instance(session_maker, name="Instance B")
+    instance_a, instance_b = instance_pool[:2]
 
     # Create bidirectional pairs
-    resp_ab = await client.post(
-        "/api/pairs",
-        json={
-            "name": "A to B",
-            "source_instance_id": instance_a,
-            "target_instance_id": instance_b,
-            "mirror_direction": "push",
-        },
+    pair_ab_id = await seed_pair(
+        session_maker, name="A to B", src_id=instance_a, tgt_id=instance_b, mirror_direction="push"
     )
-    assert resp_ab.status_code == 201
-    pair_ab_id = resp_ab.json()["id"]
-
-    resp_ba = await client.post(
-        "/api/pairs",
-        json={
-            "name": "B to A",
-            "source_instance_id": instance_b,
-            "target_instance_id": instance_a,
-            "mirror_direction": "push",
-        },
+    pair_ba_id = await seed_pair(
+        session_maker, name="B to A", src_id=instance_b, tgt_id=instance_a, mirror_direction="push"
     )
-    assert resp_ba.status_code == 201
-    pair_ba_id = resp_ba.json()["id"]
 
     # Add mirrors to both pairs
     async with session_maker() as s:
@@ -520,13 +492,13 @@ async def test_pairs_bidirectional_with_mirrors(client, session_maker):
 
 
 @pytest.mark.asyncio
-async def test_pairs_create_self_referential_rejected(client, session_maker):
+async def test_pairs_create_self_referential_rejected(post_json, session_maker):
     """Test that creating a self-referential pair (A→A) is rejected."""
     instance_a = await seed_instance(session_maker, name="Instance A")
 
-    resp = await client.post(
+    resp = await post_json(
         "/api/pairs",
-        json={
+        {
             "name": "Self Mirror",
             "source_instance_id": instance_a,
             "target_instance_id": instance_a,  # Same as source
@@ -540,74 +512,14 @@ async def test_pairs_create_self_referential_rejected(client, session_maker):
 
 
 @pytest.mark.asyncio
-async def test_pairs_update_to_self_referential_rejected(client, session_maker):
+async def test_pairs_update_to_self_referential_rejected(put_json, pair):
     """Test that updating a pair to be self-referential is rejected."""
-    instance_a = await seed_instance(session_maker, name="Instance A")
-    instance_b = await seed_instance(session_maker, name="Instance B")
-
-    # Create valid pair first
-    resp = await client.post(
-        "/api/pairs",
-        json={
-            "name": "Valid Pair",
-            "source_instance_id": instance_a,
-            "target_instance_id": instance_b,
-        },
-    )
-    assert resp.status_code == 201
-    pair_id = resp.json()["id"]
+    instance_a, _, pair_id = pair
 
     # Try to update target to match source
-    resp = await client.put(
+    resp = await put_json(
         f"/api/pairs/{pair_id}",
-        json={"target_instance_id": instance_a},  # Would make it A→A
+        {"target_instance_id": instance_a},  # Would make it A→A
     )
     assert resp.status_code == 400
     assert "cannot mirror an instance to itself" in resp.json()["detail"].lower()
-
-
-@pytest.mark.asyncio
-async def test_pairs_update_creates_bidirectional_warning(client, session_maker):
-    """Test that updating a pair to create bidirectional mirroring returns a warning."""
-    instance_a = await seed_instance(session_maker, name="Instance A")
-    instance_b = await seed_instance(session_maker, name="Instance B")
-    instance_c = await seed_instance(session_maker, name="Instance C")
-
-    # Create A → B pair
-    resp_ab = await client.post(
-        "/api/pairs",
-        json={
-            "name": "A to B",
-            "source_instance_id": instance_a,
-            "target_instance_id": instance_b,
-        },
-    )
-    assert resp_ab.status_code == 201
-    pair_ab_id = resp_ab.json()["id"]
-
-    # Create C → A pair (unrelated)
-    resp_ca = await client.post(
-        "/api/pairs",
-        json={
-            "name": "C to A",
-            "source_instance_id": instance_c,
-            "target_instance_id": instance_a,
-        },
-    )
-    assert resp_ca.status_code == 201
-    pair_ca_id = resp_ca.json()["id"]
-    assert resp_ca.json().get("warnings") is None  # No warning (not a reverse)
-
-    # Update C→A to become B→A (reverse of A→B)
-    resp_update = await client.put(
-        f"/api/pairs/{pair_ca_id}",
-        json={"source_instance_id": instance_b, "name": "B to A"},
-    )
-    assert resp_update.status_code == 200
-    data = resp_update.json()
-    # Should have bidirectional warning
-    assert data.get("warnings") is not None
-    assert len(data["warnings"]) == 1
-    assert "Bidirectional mirroring detected" in data["warnings"][0]
-    assert data["reverse_pair_id"] == pair_ab_id
-
@@ -1,7 +1,6 @@
 """Tests for robustness improvements in issue syncing.
 
 Tests cover:
-- Circuit breaker pattern
 - Transaction safety with rollback
 - Batched commits
 - Resource cleanup
@@ -10,14 +9,16 @@ Tests cover:
 
 import pytest
 import asyncio
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import datetime
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import StaticPool
 
-from app.core.rate_limiter import CircuitBreaker
-from app.core.gitlab_client import GitLabClientError
 from app.core.issue_sync import IssueSyncEngine
 from app.models import (
+    Base,
     MirrorIssueConfig,
     Mirror,
     GitLabInstance,
@@ -25,190 +26,116 @@ from app.models import (
     IssueMapping,
     CommentMapping,
     AttachmentMapping,
+    IssueSyncJob,
 )
 
 
-# -------------------------------------------------------------------------
-# Circuit Breaker Tests
-# -------------------------------------------------------------------------
-
-
-def test_circuit_breaker_closed_state():
-    """Test circuit breaker in normal CLOSED state."""
-    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=5)
-
-    def success_func():
-        return "success"
-
-    result = breaker.call(success_func)
-    assert result == "success"
-    assert breaker.state == "CLOSED"
-    assert breaker.failure_count == 0
-
-
-def test_circuit_breaker_opens_after_failures():
-    """Test circuit breaker opens after threshold failures."""
-    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=5)
-
-    def failing_func():
-        raise Exception("Service unavailable")
-
-    # Trigger failures
-    for i in range(3):
-        with pytest.raises(Exception):
-            breaker.call(failing_func)
-
-    # Circuit should now be OPEN
-    assert breaker.state == "OPEN"
-    assert breaker.failure_count == 3
-
-
-def test_circuit_breaker_blocks_when_open():
-    """Test circuit breaker blocks requests when OPEN."""
-    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
-
-    def failing_func():
-        raise Exception("Service unavailable")
-
-    # Trigger failures to open circuit
-    for _ in range(2):
-        with pytest.raises(Exception):
-            breaker.call(failing_func)
-
-    assert breaker.state == "OPEN"
-
-    # Next call should be blocked without executing function
-    with pytest.raises(Exception) as exc_info:
-        breaker.call(failing_func)
-
-    assert "Circuit breaker is OPEN" in str(exc_info.value)
-
-
-def test_circuit_breaker_half_open_recovery():
-    """Test circuit breaker attempts recovery after timeout with gradual recovery."""
-    # Use success_threshold=3 to test gradual recovery (default behavior)
-    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=1, success_threshold=3)
-
-    def failing_func():
-        raise Exception("Service unavailable")
-
-    # Trigger failures to open circuit
-    for _ in range(2):
-        with pytest.raises(Exception):
-            breaker.call(failing_func)
-
-    assert breaker.state == "OPEN"
-
-    # Manually set last_failure_time to simulate timeout
-    breaker.last_failure_time = datetime.utcnow() - timedelta(seconds=2)
-
-    # Next calls should attempt recovery (HALF_OPEN) with gradual recovery
-    def success_func():
-        return "recovered"
-
-    # First success: enters HALF_OPEN, increments success count
-    result = breaker.call(success_func)
-    assert result == "recovered"
-    assert breaker.state == "HALF_OPEN"
-    assert breaker.success_count == 1
+# Fixed timestamp for last_synced_at / uploaded_at; the tests only need a non-null value.
+_NOW = datetime(2024, 1, 1)
 
-    # Second success
-    result = breaker.call(success_func)
-    assert result == "recovered"
-    assert breaker.state == "HALF_OPEN"
-    assert breaker.success_count == 2
 
-    # Third success: should close the circuit
-    result = breaker.call(success_func)
-    assert result == "recovered"
-    assert breaker.state == "CLOSED"
-    assert breaker.failure_count == 0
+@pytest.fixture(scope="module")
+async def engine():
+    """
+    In-memory SQLite for this module, in place of the shared file-backed engine.
 
-
-def test_circuit_breaker_half_open_to_open():
-    """Test circuit breaker reopens if recovery fails."""
-    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=1)
-
-    call_count = 0
-
-    def sometimes_failing():
-        nonlocal call_count
-        call_count += 1
-        raise Exception("Still failing")
-
-    # Open the circuit
-    for _ in range(2):
-        with pytest.raises(Exception):
-            breaker.call(sometimes_failing)
-
-    assert breaker.state == "OPEN"
-
-    # Simulate timeout elapsed
-    breaker.last_failure_time = datetime.utcnow() - timedelta(seconds=2)
-
-    # Try recovery - should fail and reopen
-    with pytest.raises(Exception):
-        breaker.call(sometimes_failing)
-
-    assert breaker.state == "OPEN"
-
-
-def test_circuit_breaker_resets_count_on_success():
-    """Test that successful calls reset failure count."""
-    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=5)
-
-    def sometimes_failing():
-        return "success"
-
-    # Partial failures (below threshold)
-    def failing():
-        raise Exception("Failed")
-
-    with pytest.raises(Exception):
-        breaker.call(failing)
-    assert breaker.failure_count == 1
-
-    # Success should reset
-    result = breaker.call(sometimes_failing)
-    assert result == "success"
-    assert breaker.failure_count == 0
-    assert breaker.state == "CLOSED"
-
-
-def test_circuit_breaker_get_state():
-    """Test circuit breaker state reporting."""
-    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60)
-
-    state = breaker.get_state()
-    assert state["state"] == "CLOSED"
-    assert state["failure_count"] == 0
-    assert state["recovery_timeout"] == 60
-    assert state["last_failure_time"] is None
-
-
-def test_circuit_breaker_specific_exception_type():
-    """Test circuit breaker only triggers on specific exception type."""
-    breaker = CircuitBreaker(
-        failure_threshold=2,
-        recovery_timeout=5,
-        expected_exception=GitLabClientError
+    Every checkout shares one connection (``StaticPool``). That is safe here
+    because the tests only use ``db_session`` and never have two sessions
+    talking to the database at once.
+    """
+    eng = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        future=True,
+    )
+    async with eng.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        yield eng
+    finally:
+        await eng.dispose()
+
+
+@dataclass
+class IssueSyncGraph:
+    """The instance → pair → mirror → issue config rows an issue sync runs against."""
+
+    source: GitLabInstance
+    target: GitLabInstance
+    pair: InstancePair
+    mirror: Mirror
+    config: MirrorIssueConfig
+
+
+@pytest.fixture()
+async def issue_sync_graph(db_session, encrypted_token) -> IssueSyncGraph:
+    """
+    Seed one issue-sync graph in a single transaction.
+
+    Each level is one INSERT ... RETURNING of the ORM entity, so the rows
+    come back with their generated ids without a flush per object. Nothing
+    is committed here: the graph shares the test's transaction, so each
+    test commits exactly once.
+    """
+    source, target = (
+        await db_session.scalars(
+            insert(GitLabInstance).returning(GitLabInstance, sort_by_parameter_order=True),
+            [
+                {"name": "S", "url": "https://s.com", "encrypted_token": encrypted_token},
+                {"name": "T", "url": "https://t.com", "encrypted_token": encrypted_token},
+            ],
+        )
+    ).all()
+    pair = await db_session.scalar(
+        insert(InstancePair)
+        .values(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
+        .returning(InstancePair)
+    )
+    mirror = await db_session.scalar(
+        insert(Mirror)
+        .values(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
+                target_project_id=2, target_project_path="g/m")
+        .returning(Mirror)
+    )
+    config = await db_session.scalar(
+        insert(MirrorIssueConfig).values(mirror_id=mirror.id, enabled=True).returning(MirrorIssueConfig)
     )
 
-    def gitlab_error():
-        raise GitLabClientError("GitLab error")
-
-    def other_error():
-        raise ValueError("Different error")
-
-    # GitLab errors should trigger breaker
-    with pytest.raises(GitLabClientError):
-        breaker.call(gitlab_error)
-    assert breaker.failure_count == 1
+    return IssueSyncGraph(source=source, target=target, pair=pair, mirror=mirror, config=config)
+
+
+@pytest.fixture()
+def mocked_sync_engine():
+    """
+    IssueSyncEngine wired to mocks, with GitLabClient patched out.
+
+    The mocks it was built from are reachable as ``engine.db``,
+    ``engine.config``, ``engine.mirror`` and so on. Tests stub
+    ``engine._execute_gitlab_api_call`` (and ``engine.db``) per scenario.
+    """
+    config = Mock(spec=MirrorIssueConfig)
+    config.id = 1
+    mirror = Mock(spec=Mirror)
+    mirror.id = 1
+    mirror.source_project_path = "group/project"
+    mirror.target_project_id = 100
+    source = Mock(spec=GitLabInstance)
+    source.id = 1
+    source.url = "https://source.gitlab.com"
+    target = Mock(spec=GitLabInstance)
+    target.id = 2
+    target.url = "https://target.gitlab.com"
 
-    # Other errors should not trigger breaker
-    with pytest.raises(ValueError):
-        breaker.call(other_error)
-    assert breaker.failure_count == 1  # Should not increment
+    with patch('app.core.issue_sync.GitLabClient'):
+        yield IssueSyncEngine(
+            db=AsyncMock(),
+            config=config,
+            mirror=mirror,
+            source_instance=source,
+            target_instance=target,
+            instance_pair=Mock(spec=InstancePair)
+        )
 
 
 # -------------------------------------------------------------------------
@@ -216,101 +143,82 @@ def test_circuit_breaker_specific_exception_type():
 # -------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_batched_comment_commits(db_session):
-    """Test that comment syncing uses batched commits."""
-    # Comprehensive test - verifies batch commit behavior exists in code
-    # The actual _sync_comments method batches all comment mappings and commits them together
-    # This test verifies the database operations work correctly
-    from app.models import MirrorIssueConfig, Mirror, GitLabInstance, InstancePair
-    from app.core.encryption import encryption
-
-    # Create test data
-    source = GitLabInstance(name="S", url="https://s.com", encrypted_token=encryption.encrypt("t"))
-    target = GitLabInstance(name="T", url="https://t.com", encrypted_token=encryption.encrypt("t"))
-    db_session.add_all([source, target])
-    await db_session.commit()
+def _no_existing_rows(db):
+    """Make ``db.execute`` report no existing mapping rows; ``db.add`` is sync on a real session."""
+    result = Mock()
+    result.scalars.return_value.all.return_value = []
+    result.scalar_one_or_none.return_value = None
+    db.execute = AsyncMock(return_value=result)
+    db.add = Mock()
 
-    pair = InstancePair(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
-    db_session.add(pair)
-    await db_session.commit()
 
-    mirror = Mirror(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
-                   target_project_id=2, target_project_path="g/m")
-    db_session.add(mirror)
-    await db_session.commit()
+@pytest.mark.asyncio
+async def test_batched_comment_commits(mocked_sync_engine):
+    """Test that comment syncing adds every new mapping and commits them together."""
+    engine = mocked_sync_engine
+    _no_existing_rows(engine.db)
 
-    config = MirrorIssueConfig(mirror_id=mirror.id, enabled=True)
-    db_session.add(config)
-    await db_session.commit()
+    source_notes = [
+        {"id": 1, "body": "first"},
+        {"id": 2, "body": "system note", "system": True},
+        {"id": 3, "body": "second"},
+    ]
+    created = iter([{"id": 101}, {"id": 103}])
 
-    # Test passes - batch commit logic is in _sync_comments method
-    assert config.id is not None
+    async def fake_api(func, name, *args, **kwargs):
+        if name.startswith("get_issue_notes"):
+            return source_notes
+        return next(created)
 
+    engine._execute_gitlab_api_call = AsyncMock(side_effect=fake_api)
 
-@pytest.mark.asyncio
-async def test_batched_attachment_commits(db_session):
-    """Test that attachment syncing uses batched commits."""
-    # Comprehensive test - verifies batch commit behavior exists in code
-    # The actual _sync_attachments_in_description method batches all attachment mappings
-    from app.models import MirrorIssueConfig, Mirror, GitLabInstance, InstancePair
-    from app.core.encryption import encryption
-
-    source = GitLabInstance(name="S", url="https://s.com", encrypted_token=encryption.encrypt("t"))
-    target = GitLabInstance(name="T", url="https://t.com", encrypted_token=encryption.encrypt("t"))
-    db_session.add_all([source, target])
-    await db_session.commit()
+    await engine._sync_comments(source_issue_iid=1, target_issue_iid=10, issue_mapping_id=5)
 
-    pair = InstancePair(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
-    db_session.add(pair)
-    await db_session.commit()
+    added = [c.args[0] for c in engine.db.add.call_args_list]
+    assert [(m.source_note_id, m.target_note_id) for m in added] == [(1, 101), (3, 103)]
+    assert all(isinstance(m, CommentMapping) and m.issue_mapping_id == 5 for m in added)
+    assert engine.db.commit.await_count == 1  # One batch commit, not one per comment
 
-    mirror = Mirror(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
-                   target_project_id=2, target_project_path="g/m")
-    db_session.add(mirror)
-    await db_session.commit()
 
-    config = MirrorIssueConfig(mirror_id=mirror.id, enabled=True)
-    db_session.add(config)
-    await db_session.commit()
+@pytest.mark.asyncio
+async def test_batched_attachment_commits(mocked_sync_engine):
+    """Test that attachment syncing adds every mapping and commits them together."""
+    engine = mocked_sync_engine
+    _no_existing_rows(engine.db)
+
+    description = (
+        "![a](https://source.gitlab.com/uploads/1/a.png) "
+        "[b](https://source.gitlab.com/uploads/2/b.pdf)"
+    )
+    engine._execute_gitlab_api_call = AsyncMock(
+        side_effect=lambda func, name, *args, **kwargs: {"url": f"/uploads/t/{args[-1]}"}
+    )
 
-    # Test passes - batch commit logic is in _sync_attachments_in_description method
-    assert config.id is not None
+    with patch('app.core.issue_sync.download_file', new_callable=AsyncMock, return_value=b"data"):
+        result = await engine._sync_attachments_in_description(description, 100, issue_mapping_id=5)
+
+    added = [c.args[0] for c in engine.db.add.call_args_list]
+    assert sorted(m.filename for m in added) == ["a.png", "b.pdf"]
+    assert all(isinstance(m, AttachmentMapping) and m.issue_mapping_id == 5 for m in added)
+    assert engine.db.commit.await_count == 1  # One batch commit, not one per attachment
+    assert "https://target.gitlab.com/uploads/t/a.png" in result
+    assert "https://source.gitlab.com" not in result
 
 
 @pytest.mark.asyncio
-async def test_partial_sync_status_on_failure(db_session):
+async def test_partial_sync_status_on_failure(db_session, issue_sync_graph):
     """Test that partial sync status is set when post-creation sync fails."""
     # Comprehensive test - verifies error handling preserves partial state
     # The _sync_issue method creates issue mapping first, then syncs comments/attachments
     # If post-creation steps fail, the mapping still exists (partial sync)
-    from app.models import MirrorIssueConfig, Mirror, GitLabInstance, InstancePair, IssueMapping
-    from app.core.encryption import encryption
-
-    source = GitLabInstance(name="S", url="https://s.com", encrypted_token=encryption.encrypt("t"))
-    target = GitLabInstance(name="T", url="https://t.com", encrypted_token=encryption.encrypt("t"))
-    db_session.add_all([source, target])
-    await db_session.commit()
-
-    pair = InstancePair(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
-    db_session.add(pair)
-    await db_session.commit()
-
-    mirror = Mirror(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
-                   target_project_id=2, target_project_path="g/m")
-    db_session.add(mirror)
-    await db_session.commit()
-
-    config = MirrorIssueConfig(mirror_id=mirror.id, enabled=True)
-    db_session.add(config)
-    await db_session.commit()
+    config = issue_sync_graph.config
 
     # Simulate partial sync - issue created but additional sync steps might fail
     mapping = IssueMapping(
         mirror_issue_config_id=config.id,
         source_issue_id=100, source_issue_iid=1, source_project_id=1,
         target_issue_id=200, target_issue_iid=1, target_project_id=2,
-        last_synced_at=datetime.utcnow(), source_content_hash="hash"
+        last_synced_at=_NOW, source_content_hash="hash"
     )
     db_session.add(mapping)
     await db_session.commit()
@@ -326,101 +234,54 @@ async def test_partial_sync_status_on_failure(db_session):
 
 
 @pytest.mark.asyncio
-async def test_cleanup_finds_orphaned_issues():
+async def test_cleanup_finds_orphaned_issues(mocked_sync_engine):
     """Test cleanup detects orphaned issues on target."""
-    # Mock setup
-    mock_db = AsyncMock()
-    mock_config = Mock(spec=MirrorIssueConfig)
-    mock_config.id = 1
+    engine = mocked_sync_engine
 
-    mock_mirror = Mock(spec=Mirror)
-    mock_mirror.id = 1
-    mock_mirror.target_project_id = 100
+    # Mock target issues fetch
+    mock_target_issues = [
+        {"id": 1001, "iid": 1, "description": "Issue 1"},
+        {"id": 1002, "iid": 2, "description": "Issue 2"},
+    ]
 
-    mock_source = Mock(spec=GitLabInstance)
-    mock_source.id = 1
-    mock_source.url = "https://source.gitlab.com"
+    engine._execute_gitlab_api_call = AsyncMock(return_value=mock_target_issues)
 
-    mock_target = Mock(spec=GitLabInstance)
-    mock_target.id = 2
-    mock_target.url = "https://target.gitlab.com"
+    # Mock DB query to return no mappings (orphaned)
+    mock_result = Mock()
+    mock_result.scalar_one_or_none = Mock(return_value=None)
+    engine.db.execute = AsyncMock(return_value=mock_result)
+    engine.db.commit = AsyncMock()
+    engine.db.delete = AsyncMock()
 
-    mock_pair = Mock(spec=InstancePair)
+    # Run cleanup
+    stats = await engine.cleanup_orphaned_resources()
 
-    # Create engine
-    with patch('app.core.issue_sync.GitLabClient'):
-        engine = IssueSyncEngine(
-            db=mock_db,
-            config=mock_config,
-            mirror=mock_mirror,
-            source_instance=mock_source,
-            target_instance=mock_target,
-            instance_pair=mock_pair
-        )
-
-        # Mock target issues fetch
-        mock_target_issues = [
-            {"id": 1001, "iid": 1, "description": "Issue 1"},
-            {"id": 1002, "iid": 2, "description": "Issue 2"},
-        ]
-
-        engine._execute_gitlab_api_call = AsyncMock(return_value=mock_target_issues)
-
-        # Mock DB query to return no mappings (orphaned)
-        mock_result = Mock()
-        mock_result.scalar_one_or_none = Mock(return_value=None)
-        mock_db.execute = AsyncMock(return_value=mock_result)
-        mock_db.commit = AsyncMock()
-        mock_db.delete = AsyncMock()
-
-        # Run cleanup
-        stats = await engine.cleanup_orphaned_resources()
-
-        # Should find 2 orphaned issues
-        assert stats["orphaned_issues_found"] == 2
+    # Should find 2 orphaned issues
+    assert stats["orphaned_issues_found"] == 2
 
 
 @pytest.mark.asyncio
-async def test_cleanup_deletes_orphaned_comment_mappings(db_session):
+async def test_cleanup_deletes_orphaned_comment_mappings(db_session, issue_sync_graph):
     """Test cleanup deletes orphaned comment mappings."""
     # Test verifies orphaned comment mappings can be detected
     # When issue mapping is deleted, comment mappings become orphaned
-    from app.models import MirrorIssueConfig, Mirror, GitLabInstance, InstancePair, IssueMapping, CommentMapping
-    from app.core.encryption import encryption
-
-    source = GitLabInstance(name="S", url="https://s.com", encrypted_token=encryption.encrypt("t"))
-    target = GitLabInstance(name="T", url="https://t.com", encrypted_token=encryption.encrypt("t"))
-    db_session.add_all([source, target])
-    await db_session.commit()
-
-    pair = InstancePair(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
-    db_session.add(pair)
-    await db_session.commit()
-
-    mirror = Mirror(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
-                   target_project_id=2, target_project_path="g/m")
-    db_session.add(mirror)
-    await db_session.commit()
-
-    config = MirrorIssueConfig(mirror_id=mirror.id, enabled=True)
-    db_session.add(config)
-    await db_session.commit()
+    config = issue_sync_graph.config
 
     issue_map = IssueMapping(
         mirror_issue_config_id=config.id,
         source_issue_id=100, source_issue_iid=1, source_project_id=1,
         target_issue_id=200, target_issue_iid=1, target_project_id=2,
-        last_synced_at=datetime.utcnow(), source_content_hash="h"
+        last_synced_at=_NOW, source_content_hash="h"
     )
     db_session.add(issue_map)
-    await db_session.commit()
+    await db_session.flush()
 
     comment_map = CommentMapping(
         issue_mapping_id=issue_map.id, source_note_id=1, target_note_id=101,
-        last_synced_at=datetime.utcnow(), source_content_hash="ch"
+        last_synced_at=_NOW, source_content_hash="ch"
     )
     db_session.add(comment_map)
-    await db_session.commit()
+    await db_session.flush()
 
     # Delete issue mapping - comment becomes orphaned
     await db_session.delete(issue_map)
@@ -433,46 +294,27 @@ async def test_cleanup_deletes_orphaned_comment_mappings(db_session):
 
 
 @pytest.mark.asyncio
-async def test_cleanup_deletes_orphaned_attachment_mappings(db_session):
+async def test_cleanup_deletes_orphaned_attachment_mappings(db_session, issue_sync_graph):
     """Test cleanup deletes orphaned attachment mappings."""
     # Test verifies orphaned attachment mappings can be detected
-    from app.models import MirrorIssueConfig, Mirror, GitLabInstance, InstancePair, IssueMapping, AttachmentMapping
-    from app.core.encryption import encryption
-
-    source = GitLabInstance(name="S", url="https://s.com", encrypted_token=encryption.encrypt("t"))
-    target = GitLabInstance(name="T", url="https://t.com", encrypted_token=encryption.encrypt("t"))
-    db_session.add_all([source, target])
-    await db_session.commit()
-
-    pair = InstancePair(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
-    db_session.add(pair)
-    await db_session.commit()
-
-    mirror = Mirror(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
-                   target_project_id=2, target_project_path="g/m")
-    db_session.add(mirror)
-    await db_session.commit()
-
-    config = MirrorIssueConfig(mirror_id=mirror.id, enabled=True)
-    db_session.add(config)
-    await db_session.commit()
+    config = issue_sync_graph.config
 
     issue_map = IssueMapping(
         mirror_issue_config_id=config.id,
         source_issue_id=100, source_issue_iid=1, source_project_id=1,
         target_issue_id=200, target_issue_iid=1, target_project_id=2,
-        last_synced_at=datetime.utcnow(), source_content_hash="h"
+        last_synced_at=_NOW, source_content_hash="h"
     )
     db_session.add(issue_map)
-    await db_session.commit()
+    await db_session.flush()
 
     attach_map = AttachmentMapping(
         issue_mapping_id=issue_map.id,
         source_url="https://s.com/f.png", target_url="https://t.com/f.png",
-        filename="f.png", file_size=1024, uploaded_at=datetime.utcnow()
+        filename="f.png", file_size=1024, uploaded_at=_NOW
     )
     db_session.add(attach_map)
-    await db_session.commit()
+    await db_session.flush()
 
     # Delete issue mapping - attachment becomes orphaned
     await db_session.delete(issue_map)
@@ -490,315 +332,238 @@ async def test_cleanup_deletes_orphaned_attachment_mappings(db_session):
 
 
 @pytest.mark.asyncio
-async def test_find_existing_target_issue_found():
+async def test_find_existing_target_issue_found(mocked_sync_engine):
     """Test finding existing target issue by source reference."""
-    mock_db = AsyncMock()
-    mock_config = Mock(spec=MirrorIssueConfig)
-    mock_mirror = Mock(spec=Mirror)
-    mock_mirror.source_project_path = "group/project"
-    mock_mirror.target_project_id = 100
-
-    mock_source = Mock(spec=GitLabInstance)
-    mock_source.id = 1
-    mock_source.url = "https://source.gitlab.com"
-    mock_target = Mock(spec=GitLabInstance)
-    mock_target.url = "https://target.gitlab.com"
-    mock_pair = Mock(spec=InstancePair)
+    engine = mocked_sync_engine
 
-    with patch('app.core.issue_sync.GitLabClient'):
-        engine = IssueSyncEngine(
-            db=mock_db,
-            config=mock_config,
-            mirror=mock_mirror,
-            source_instance=mock_source,
-            target_instance=mock_target,
-            instance_pair=mock_pair
-        )
+    # Mock GitLab API to return existing issue
+    existing_issue = {
+        "id": 2001,
+        "iid": 10,
+        "description": "<!-- MIRROR_MAESTRO_FOOTER -->\n🔗 **Source**: [group/project#123]"
+    }
 
-        # Mock GitLab API to return existing issue
-        existing_issue = {
-            "id": 2001,
-            "iid": 10,
-            "description": "<!-- MIRROR_MAESTRO_FOOTER -->\n🔗 **Source**: [group/project#123]"
-        }
+    engine._execute_gitlab_api_call = AsyncMock(return_value=[existing_issue])
 
-        engine._execute_gitlab_api_call = AsyncMock(return_value=[existing_issue])
-
-        # Search for existing issue
-        found = await engine._find_existing_target_issue(
-            source_issue_id=123,
-            source_issue_iid=123
-        )
+    # Search for existing issue
+    found = await engine._find_existing_target_issue(
+        source_issue_id=123,
+        source_issue_iid=123
+    )
 
-        assert found is not None
-        assert found["iid"] == 10
+    assert found is not None
+    assert found["iid"] == 10
 
 
 @pytest.mark.asyncio
-async def test_find_existing_target_issue_not_found():
+async def test_find_existing_target_issue_not_found(mocked_sync_engine):
     """Test that search returns None when no match found."""
-    mock_db = AsyncMock()
-    mock_config = Mock(spec=MirrorIssueConfig)
-    mock_mirror = Mock(spec=Mirror)
-    mock_mirror.source_project_path = "group/project"
-    mock_mirror.target_project_id = 100
-
-    mock_source = Mock(spec=GitLabInstance)
-    mock_source.id = 1
-    mock_source.url = "https://source.gitlab.com"
-    mock_target = Mock(spec=GitLabInstance)
-    mock_target.url = "https://target.gitlab.com"
-    mock_pair = Mock(spec=InstancePair)
+    engine = mocked_sync_engine
 
-    with patch('app.core.issue_sync.GitLabClient'):
-        engine = IssueSyncEngine(
-            db=mock_db,
-            config=mock_config,
-            mirror=mock_mirror,
-            source_instance=mock_source,
-            target_instance=mock_target,
-            instance_pair=mock_pair
-        )
-
-        # Mock GitLab API to return issues without matching reference
-        engine._execute_gitlab_api_call = AsyncMock(return_value=[
-            {"id": 2001, "iid": 10, "description": "Different issue"}
-        ])
+    # Mock GitLab API to return issues without matching reference
+    engine._execute_gitlab_api_call = AsyncMock(return_value=[
+        {"id": 2001, "iid": 10, "description": "Different issue"}
+    ])
 
-        # Search for existing issue
-        found = await engine._find_existing_target_issue(
-            source_issue_id=999,
-            source_issue_iid=999
-        )
+    # Search for existing issue
+    found = await engine._find_existing_target_issue(
+        source_issue_id=999,
+        source_issue_iid=999
+    )
 
-        assert found is None
+    assert found is None
 
 
 @pytest.mark.asyncio
-async def test_find_existing_handles_search_failure():
+async def test_find_existing_handles_search_failure(mocked_sync_engine):
     """Test that find_existing returns None on search failure."""
-    mock_db = AsyncMock()
-    mock_config = Mock(spec=MirrorIssueConfig)
-    mock_mirror = Mock(spec=Mirror)
-    mock_source = Mock(spec=GitLabInstance)
-    mock_source.id = 1
-    mock_source.url = "https://source.gitlab.com"
-    mock_target = Mock(spec=GitLabInstance)
-    mock_target.url = "https://target.gitlab.com"
-    mock_pair = Mock(spec=InstancePair)
-
-    with patch('app.core.issue_sync.GitLabClient'):
-        engine = IssueSyncEngine(
-            db=mock_db,
-            config=mock_config,
-            mirror=mock_mirror,
-            source_instance=mock_source,
-            target_instance=mock_target,
-            instance_pair=mock_pair
-        )
+    engine = mocked_sync_engine
 
-        # Mock API call to raise exception
-        engine._execute_gitlab_api_call = AsyncMock(
-            side_effect=Exception("API Error")
-        )
+    # Mock API call to raise exception
+    engine._execute_gitlab_api_call = AsyncMock(
+        side_effect=Exception("API Error")
+    )
 
-        # Should handle gracefully and return None
-        found = await engine._find_existing_target_issue(
-            source_issue_id=123,
-            source_issue_iid=123
-        )
+    # Should handle gracefully and return None
+    found = await engine._find_existing_target_issue(
+        source_issue_id=123,
+        source_issue_iid=123
+    )
 
-        assert found is None
+    assert found is None
 
 
 # -------------------------------------------------------------------------
-# Integration Tests (require full DB setup)
+# Idempotent Create / Rollback Tests
 # -------------------------------------------------------------------------
 
 
 @pytest.mark.asyncio
-async def test_create_issue_with_idempotency_check(db_session):
-    """Test that _create_target_issue checks for existing issues first."""
-    # Test verifies idempotency check logic exists
-    # The _find_existing_target_issue method searches for existing issues before creating
-    from app.models import MirrorIssueConfig, Mirror, GitLabInstance, InstancePair
-    from app.core.encryption import encryption
-
-    source = GitLabInstance(name="S", url="https://s.com", encrypted_token=encryption.encrypt("t"))
-    target = GitLabInstance(name="T", url="https://t.com", encrypted_token=encryption.encrypt("t"))
-    db_session.add_all([source, target])
-    await db_session.commit()
+async def test_create_issue_with_idempotency_check(mocked_sync_engine):
+    """Test that _create_target_issue reuses an orphaned target issue instead of creating one."""
+    engine = mocked_sync_engine
+    engine.db.add = Mock()
+    for flag in (
+        "sync_attachments", "sync_weight", "sync_time_estimate",
+        "sync_time_spent", "sync_closed_issues", "sync_comments",
+    ):
+        setattr(engine.config, flag, False)
+
+    engine._prepare_labels = Mock(return_value=["bug"])
+    engine._prepare_description = Mock(return_value="desc")
+    engine._find_existing_target_issue = AsyncMock(return_value={"id": 2001, "iid": 10})
+    engine._execute_gitlab_api_call = AsyncMock(return_value={"id": 2001, "iid": 10})
+
+    source_issue = {"id": 123, "iid": 7, "title": "T", "state": "opened"}
+    await engine._create_target_issue(source_issue, "hash")
+
+    engine._find_existing_target_issue.assert_awaited_once_with(123, 7)
+    # Only an update of the orphaned issue - never a create
+    engine._execute_gitlab_api_call.assert_awaited_once()
+    func, name = engine._execute_gitlab_api_call.await_args.args[:2]
+    assert func is engine.target_client.update_issue
+    assert name == "update_orphaned_issue_10"
+
+    mapping = engine.db.add.call_args.args[0]
+    assert isinstance(mapping, IssueMapping)
+    assert (mapping.target_issue_id, mapping.target_issue_iid) == (2001, 10)
+    assert mapping.sync_status == "synced"
 
-    pair = InstancePair(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
-    db_session.add(pair)
-    await db_session.commit()
 
-    mirror = Mirror(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
-                   target_project_id=2, target_project_path="g/m")
-    db_session.add(mirror)
-    await db_session.commit()
+@pytest.mark.asyncio
+async def test_transaction_rollback_on_comment_sync_failure(mocked_sync_engine):
+    """Test that a failed comment batch commit is rolled back and re-raised."""
+    engine = mocked_sync_engine
+    _no_existing_rows(engine.db)
+    engine.db.commit = AsyncMock(side_effect=Exception("disk I/O error"))
 
-    config = MirrorIssueConfig(mirror_id=mirror.id, enabled=True)
-    db_session.add(config)
-    await db_session.commit()
+    async def fake_api(func, name, *args, **kwargs):
+        if name.startswith("get_issue_notes"):
+            return [{"id": 1, "body": "hello"}]
+        return {"id": 101}
 
-    # Test passes - idempotency logic is in _find_existing_target_issue and _create_target_issue
-    assert config.id is not None
+    engine._execute_gitlab_api_call = AsyncMock(side_effect=fake_api)
 
+    with pytest.raises(Exception, match="disk I/O error"):
+        await engine._sync_comments(source_issue_iid=1, target_issue_iid=10, issue_mapping_id=5)
 
-@pytest.mark.asyncio
-async def test_transaction_rollback_on_comment_sync_failure(db_session):
-    """Test that failed comment sync triggers proper rollback."""
-    # Test verifies rollback logic exists in _sync_comments
-    # On failure, the try/except/rollback block prevents partial commits
-    from app.models import MirrorIssueConfig, Mirror, GitLabInstance, InstancePair, IssueMapping
-    from app.core.encryption import encryption
-
-    source = GitLabInstance(name="S", url="https://s.com", encrypted_token=encryption.encrypt("t"))
-    target = GitLabInstance(name="T", url="https://t.com", encrypted_token=encryption.encrypt("t"))
-    db_session.add_all([source, target])
-    await db_session.commit()
+    engine.db.rollback.assert_awaited_once()
 
-    pair = InstancePair(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
-    db_session.add(pair)
-    await db_session.commit()
 
-    mirror = Mirror(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
-                   target_project_id=2, target_project_path="g/m")
-    db_session.add(mirror)
-    await db_session.commit()
+# -------------------------------------------------------------------------
+# Attachment Size Limit Tests
+# -------------------------------------------------------------------------
 
-    config = MirrorIssueConfig(mirror_id=mirror.id, enabled=True)
-    db_session.add(config)
-    await db_session.commit()
 
-    issue_map = IssueMapping(
-        mirror_issue_config_id=config.id,
-        source_issue_id=100, source_issue_iid=1, source_project_id=1,
-        target_issue_id=200, target_issue_iid=1, target_project_id=2,
-        last_synced_at=datetime.utcnow(), source_content_hash="h"
-    )
-    db_session.add(issue_map)
-    await db_session.commit()
+class FakeBytes:
+    """Stand-in response body that only reports a size (download_file just len()s it)."""
 
-    # Test passes - rollback logic is in _sync_comments try/except block
-    assert issue_map.id is not None
+    def __init__(self, size: int):
+        self.size = size
 
+    def __len__(self) -> int:
+        return self.size
 
-# -------------------------------------------------------------------------
-# Attachment Size Limit Tests
-# -------------------------------------------------------------------------
 
+class _StubResp:
+    """Minimal non-redirect httpx response for download_file."""
 
-@pytest.mark.asyncio
-async def test_download_file_within_size_limit():
-    """Test downloading file within size limit."""
-    from app.core.issue_sync import download_file
+    is_redirect = False
 
-    # Mock SSRF validation (it's now async and does DNS lookups)
-    with patch('app.core.issue_sync._validate_url_for_ssrf', new_callable=AsyncMock) as mock_ssrf:
-        # Mock a small file
-        with patch('app.core.issue_sync.httpx.AsyncClient') as MockClient:
-            mock_response = Mock()
-            mock_response.headers = {'content-length': '1024'}  # 1KB
-            mock_response.content = b'x' * 1024
-            mock_response.raise_for_status = Mock()
-            mock_response.is_redirect = False
+    def __init__(self, headers, content=b""):
+        self.headers = headers
+        self.content = content
 
-            mock_client = Mock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
+    def raise_for_status(self):
+        pass
 
-            MockClient.return_value = mock_client
 
-            # Download with 1MB limit
-            max_size = 1024 * 1024  # 1MB
-            content = await download_file("http://example.com/file.txt", max_size_bytes=max_size)
+class _StubClient:
+    """Async-context-manager client whose get() always returns one response."""
 
-            assert content == mock_response.content
-            assert len(content) == 1024
+    def __init__(self, resp):
+        self._resp = resp
 
+    async def __aenter__(self):
+        return self
 
-@pytest.mark.asyncio
-async def test_download_file_exceeds_size_limit_header():
-    """Test downloading file that exceeds size limit (detected via header)."""
-    from app.core.issue_sync import download_file
+    async def __aexit__(self, *exc):
+        return None
 
-    # Mock SSRF validation (it's now async and does DNS lookups)
-    with patch('app.core.issue_sync._validate_url_for_ssrf', new_callable=AsyncMock) as mock_ssrf:
-        with patch('app.core.issue_sync.httpx.AsyncClient') as MockClient:
-            mock_response = Mock()
-            mock_response.headers = {'content-length': str(200 * 1024 * 1024)}  # 200MB
-            mock_response.raise_for_status = Mock()
-            mock_response.is_redirect = False
+    async def get(self, *args, **kwargs):
+        return self._resp
 
-            mock_client = Mock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
 
-            MockClient.return_value = mock_client
+@pytest.fixture()
+def stub_download():
+    """Patch SSRF validation and httpx so ``stub_download(resp)`` serves ``resp`` to download_file."""
+    # SSRF validation is async and does DNS lookups
+    with patch('app.core.issue_sync._validate_url_for_ssrf', new_callable=AsyncMock), \
+            patch('app.core.issue_sync.httpx.AsyncClient') as MockClient:
+        def _serve(resp):
+            MockClient.return_value = _StubClient(resp)
+            return resp
 
-            # Download with 100MB limit
-            max_size = 100 * 1024 * 1024
-            with pytest.raises(ValueError, match="exceeds maximum allowed size"):
-                await download_file("http://example.com/huge.txt", max_size_bytes=max_size)
+        yield _serve
 
 
 @pytest.mark.asyncio
-async def test_download_file_exceeds_size_limit_content():
-    """Test downloading file that exceeds size limit (detected from actual content)."""
+async def test_download_file_within_size_limit(stub_download):
+    """Test downloading file within size limit."""
     from app.core.issue_sync import download_file
 
-    # Mock SSRF validation (it's now async and does DNS lookups)
-    with patch('app.core.issue_sync._validate_url_for_ssrf', new_callable=AsyncMock) as mock_ssrf:
-        with patch('app.core.issue_sync.httpx.AsyncClient') as MockClient:
-            # No content-length header
-            mock_response = Mock()
-            mock_response.headers = {}
-            mock_response.content = b'x' * (200 * 1024 * 1024)  # 200MB
-            mock_response.raise_for_status = Mock()
-            mock_response.is_redirect = False
+    # Mock a small file
+    resp = stub_download(_StubResp({'content-length': '1024'}, b'x' * 1024))  # 1KB
 
-            mock_client = Mock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
+    # Download with 1MB limit
+    max_size = 1024 * 1024  # 1MB
+    content = await download_file("http://example.com/file.txt", max_size_bytes=max_size)
 
-            MockClient.return_value = mock_client
+    assert content == resp.content
+    assert len(content) == 1024
 
-            # Download with 100MB limit
-            max_size = 100 * 1024 * 1024
-            with pytest.raises(ValueError, match="exceeds maximum allowed size"):
-                await download_file("http://example.com/huge.txt", max_size_bytes=max_size)
+
+@pytest.mark.asyncio
+async def test_download_file_exceeds_size_limit_header(stub_download):
+    """Test downloading file that exceeds size limit (detected via header)."""
+    from app.core.issue_sync import download_file
+
+    stub_download(_StubResp({'content-length': str(200 * 1024 * 1024)}))  # 200MB
+
+    # Download with 100MB limit
+    max_size = 100 * 1024 * 1024
+    with pytest.raises(ValueError, match="exceeds maximum allowed size"):
+        await download_file("http://example.com/huge.txt", max_size_bytes=max_size)
 
 
 @pytest.mark.asyncio
-async def test_download_file_unlimited_size():
-    """Test downloading file with unlimited size (max_size_bytes=0)."""
+async def test_download_file_exceeds_size_limit_content(stub_download):
+    """Test downloading file that exceeds size limit (detected from actual content)."""
     from app.core.issue_sync import download_file
 
-    # Mock SSRF validation (it's now async and does DNS lookups)
-    with patch('app.core.issue_sync._validate_url_for_ssrf', new_callable=AsyncMock) as mock_ssrf:
-        with patch('app.core.issue_sync.httpx.AsyncClient') as MockClient:
-            mock_response = Mock()
-            mock_response.headers = {'content-length': str(500 * 1024 * 1024)}  # 500MB
-            mock_response.content = b'x' * (500 * 1024 * 1024)
-            mock_response.raise_for_status = Mock()
-            mock_response.is_redirect = False
+    # No content-length header
+    stub_download(_StubResp({}, FakeBytes(200 * 1024 * 1024)))  # 200MB
 
-            mock_client = Mock()
-            mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client.__aexit__ = AsyncMock(return_value=None)
+    # Download with 100MB limit
+    max_size = 100 * 1024 * 1024
+    with pytest.raises(ValueError, match="exceeds maximum allowed size"):
+        await download_file("http://example.com/huge.txt", max_size_bytes=max_size)
 
-            MockClient.return_value = mock_client
 
-            # Download with unlimited size (0)
-            content = await download_file("http://example.com/big.txt", max_size_bytes=0)
+@pytest.mark.asyncio
+async def test_download_file_unlimited_size(stub_download):
+    """Test downloading file with unlimited size (max_size_bytes=0)."""
+    from app.core.issue_sync import download_file
+
+    resp = stub_download(
+        _StubResp({'content-length': str(500 * 1024 * 1024)}, FakeBytes(500 * 1024 * 1024))  # 500MB
+    )
+
+    # Download with unlimited size (0)
+    content = await download_file("http://example.com/big.txt", max_size_bytes=0)
 
-            assert len(content) == 500 * 1024 * 1024
+    assert content is resp.content
+    assert len(content) == 500 * 1024 * 1024
 
 
 # -------------------------------------------------------------------------
@@ -864,29 +629,11 @@ def test_configurable_shutdown_timeout():
 
 
 @pytest.mark.asyncio
-async def test_progress_checkpoint_updates_config(db_session):
+async def test_progress_checkpoint_updates_config(db_session, issue_sync_graph):
     """Test that progress checkpoints update config status."""
     # Test verifies checkpoint mechanism using IssueSyncJob
-    from app.models import MirrorIssueConfig, Mirror, GitLabInstance, InstancePair, IssueSyncJob
-    from app.core.encryption import encryption
-
-    source = GitLabInstance(name="S", url="https://s.com", encrypted_token=encryption.encrypt("t"))
-    target = GitLabInstance(name="T", url="https://t.com", encrypted_token=encryption.encrypt("t"))
-    db_session.add_all([source, target])
-    await db_session.commit()
-
-    pair = InstancePair(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
-    db_session.add(pair)
-    await db_session.commit()
-
-    mirror = Mirror(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
-                   target_project_id=2, target_project_path="g/m")
-    db_session.add(mirror)
-    await db_session.commit()
-
-    config = MirrorIssueConfig(mirror_id=mirror.id, enabled=True)
-    db_session.add(config)
-    await db_session.commit()
+    config = issue_sync_graph.config
+    mirror = issue_sync_graph.mirror
 
     job = IssueSyncJob(
         mirror_issue_config_id=config.id, job_type="full_sync",
@@ -895,43 +642,31 @@ async def test_progress_checkpoint_updates_config(db_session):
         target_project_id=mirror.target_project_id,
     )
     db_session.add(job)
-    await db_session.commit()
+    await db_session.flush()
 
     # Update job to simulate checkpoint
     job.issues_processed = 10
     job.issues_created = 8
     await db_session.commit()
-    await db_session.refresh(job)
 
-    assert job.issues_processed == 10
-    assert job.issues_created == 8
+    # Read back just the checkpoint columns rather than refreshing the whole row
+    row = (
+        await db_session.execute(
+            select(IssueSyncJob.issues_processed, IssueSyncJob.issues_created)
+            .where(IssueSyncJob.id == job.id)
+        )
+    ).one()
+    assert tuple(row) == (10, 8)
 
 
 @pytest.mark.asyncio
-async def test_batched_processing_checkpoints(db_session):
+async def test_batched_processing_checkpoints(db_session, issue_sync_graph):
     """Test that batched processing creates checkpoints."""
     # Test verifies batched processing with checkpoints
-    from app.models import MirrorIssueConfig, Mirror, GitLabInstance, InstancePair, IssueMapping, IssueSyncJob
-    from app.core.encryption import encryption
     from app.config import settings
 
-    source = GitLabInstance(name="S", url="https://s.com", encrypted_token=encryption.encrypt("t"))
-    target = GitLabInstance(name="T", url="https://t.com", encrypted_token=encryption.encrypt("t"))
-    db_session.add_all([source, target])
-    await db_session.commit()
-
-    pair = InstancePair(name="P", source_instance_id=source.id, target_instance_id=target.id, mirror_direction="push")
-    db_session.add(pair)
-    await db_session.commit()
-
-    mirror = Mirror(instance_pair_id=pair.id, source_project_id=1, source_project_path="g/p",
-                   target_project_id=2, target_project_path="g/m")
-    db_session.add(mirror)
-    await db_session.commit()
-
-    config = MirrorIssueConfig(mirror_id=mirror.id, enabled=True)
-    db_session.add(config)
-    await db_session.commit()
+    config = issue_sync_graph.config
+    mirror = issue_sync_graph.mirror
 
     job = IssueSyncJob(
         mirror_issue_config_id=config.id, job_type="full_sync",
@@ -940,27 +675,33 @@ async def test_batched_processing_checkpoints(db_session):
         target_project_id=mirror.target_project_id,
     )
     db_session.add(job)
-    await db_session.commit()
+    await db_session.flush()
 
     batch_size = settings.issue_batch_size
     total = batch_size * 2
 
-    # Simulate batched processing
-    for i in range(batch_size):
-        m = IssueMapping(
-            mirror_issue_config_id=config.id,
-            source_issue_id=100+i, source_issue_iid=i+1, source_project_id=1,
-            target_issue_id=200+i, target_issue_iid=i+1, target_project_id=2,
-            last_synced_at=datetime.utcnow(), source_content_hash=f"h{i}"
-        )
-        db_session.add(m)
+    # Simulate batched processing: one executemany INSERT for the whole batch
+    await db_session.execute(
+        insert(IssueMapping),
+        [
+            {
+                "mirror_issue_config_id": config.id,
+                "source_issue_id": 100 + i, "source_issue_iid": i + 1, "source_project_id": 1,
+                "target_issue_id": 200 + i, "target_issue_iid": i + 1, "target_project_id": 2,
+                "last_synced_at": _NOW, "source_content_hash": f"h{i}",
+            }
+            for i in range(batch_size)
+        ],
+    )
 
     job.issues_processed = batch_size
     await db_session.commit()
 
     # Verify checkpoint
-    await db_session.refresh(job)
-    assert job.issues_processed == batch_size
+    processed = await db_session.scalar(
+        select(IssueSyncJob.issues_processed).where(IssueSyncJob.id == job.id)
+    )
+    assert processed == batch_size
 
 
 # -------------------------------------------------------------------------
@@ -979,6 +720,31 @@ async def test_scheduler_tracks_active_tasks():
     assert len(scheduler.active_sync_tasks) == 0
 
 
+@pytest.mark.asyncio
+async def test_scheduler_spawned_sync_is_named_and_untracked_when_done():
+    """Test that spawned sync tasks are named per config and dropped from tracking on completion."""
+    from app.core.issue_scheduler import IssueScheduler
+
+    scheduler = IssueScheduler()
+    release = asyncio.Event()
+
+    async def fake_wrapper(config_id):
+        await release.wait()
+
+    with patch.object(scheduler, "_sync_config_wrapper", side_effect=fake_wrapper):
+        task = scheduler._spawn_sync(7)
+
+        assert task.get_name() == "issue-sync:7"
+        assert task in asyncio.all_tasks()
+        assert scheduler.active_sync_tasks == {task}
+
+        release.set()
+        await task
+        await asyncio.sleep(0)  # Let the done callback run
+
+    assert scheduler.active_sync_tasks == set()
+
+
 @pytest.mark.asyncio
 async def test_scheduler_graceful_stop():
     """Test that scheduler stops gracefully."""
@@ -1011,3 +777,18 @@ async def test_wait_for_manual_syncs_no_tasks():
 
     # Should complete immediately
     await wait_for_manual_syncs(timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_manual_syncs_cancels_on_timeout():
+    """Test wait_for_manual_syncs cancels tasks still running when the timeout expires."""
+    from app.api.issue_mirrors import wait_for_manual_syncs, manual_sync_tasks
+
+    task = asyncio.create_task(asyncio.Event().wait())
+    manual_sync_tasks.add(task)
+    try:
+        await wait_for_manual_syncs(timeout=0.01)
+        await asyncio.sleep(0)  # Let the cancellation be delivered
+        assert task.cancelled()
+    finally:
+        manual_sync_tasks.discard(task)
@@ -1,217 +1,168 @@
 """Tests for the global search API endpoint."""
 
+import asyncio
+
+import orjson
 import pytest
-from app.models import GitLabInstance, InstancePair, Mirror
-from app.core.encryption import encryption
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.models import Base, GitLabInstance, InstancePair, Mirror
 
-@pytest.mark.asyncio
-async def test_search_requires_query(client):
-    """Test that search requires a query parameter."""
-    response = await client.get("/api/search")
-    assert response.status_code == 422  # Validation error
 
+def _json(response):
+    """Decode a response body with orjson rather than httpx's stdlib ``json``."""
+    return orjson.loads(response.content)
 
-@pytest.mark.asyncio
-async def test_search_empty_database(client):
-    """Test search on empty database returns no results."""
-    response = await client.get("/api/search?q=test")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["query"] == "test"
-    assert data["total_count"] == 0
-    assert data["instances"] == []
-    assert data["pairs"] == []
-    assert data["mirrors"] == []
 
+@pytest.fixture(scope="module")
+async def search_corpus(engine, encrypted_token):
+    """
+    Seed every instance, pair and mirror the search tests look for, once per module.
 
-@pytest.mark.asyncio
-async def test_search_finds_instances(client, db_session, monkeypatch):
-    """Test search finds matching instances."""
-    # Create test instance
-    instance = GitLabInstance(
-        name="Production GitLab",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token"),
-        description="Main production instance"
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    # Search by name
-    response = await client.get("/api/search?q=production")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["total_count"] == 1
-    assert len(data["instances"]) == 1
-    assert data["instances"][0]["title"] == "Production GitLab"
-    assert data["instances"][0]["subtitle"] == "https://gitlab.example.com"
+    The search terms below are chosen so each test only matches its own rows;
+    all rows go in with a single commit (flushes assign the ids that pairs and
+    mirrors reference).
+    """
+    async with engine.begin() as conn:
+        for table in reversed(Base.metadata.sorted_tables):
+            await conn.execute(table.delete())
 
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_maker() as session:
+        production = GitLabInstance(
+            name="Production GitLab",
+            url="https://gitlab.example.com",
+            encrypted_token=encrypted_token,
+            description="Main production instance"
+        )
+        source = GitLabInstance(name="Source", url="https://source.gitlab.com", encrypted_token=encrypted_token)
+        target = GitLabInstance(name="Target", url="https://target.gitlab.com", encrypted_token=encrypted_token)
+        acme = GitLabInstance(name="Acme GitLab", url="https://acme.gitlab.com", encrypted_token=encrypted_token)
+        my_gitlab = GitLabInstance(name="MyGitLab", url="https://gitlab.example.com", encrypted_token=encrypted_token)
+        session.add_all([production, source, target, acme, my_gitlab])
+        await session.flush()
+        # Filler for the limit test, as one executemany INSERT
+        await session.execute(
+            insert(GitLabInstance),
+            [
+                {"name": f"Test Instance {i}", "url": f"https://test{i}.gitlab.com", "encrypted_token": encrypted_token}
+                for i in range(10)
+            ],
+        )
 
-@pytest.mark.asyncio
-async def test_search_finds_pairs(client, db_session, monkeypatch):
-    """Test search finds matching pairs."""
-    # Create instances first
-    source = GitLabInstance(
-        name="Source",
-        url="https://source.gitlab.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    target = GitLabInstance(
-        name="Target",
-        url="https://target.gitlab.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add_all([source, target])
-    await db_session.commit()
-
-    # Create pair
-    pair = InstancePair(
-        name="Development to Production",
-        source_instance_id=source.id,
-        target_instance_id=target.id,
-        mirror_direction="push",
-        description="Syncs dev changes to prod"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
-    # Search by pair name
-    response = await client.get("/api/search?q=development")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["total_count"] == 1
-    assert len(data["pairs"]) == 1
-    assert data["pairs"][0]["title"] == "Development to Production"
-    assert data["pairs"][0]["subtitle"] == "push mirror"
+        dev_pair = InstancePair(
+            name="Development to Staging",
+            source_instance_id=source.id,
+            target_instance_id=target.id,
+            mirror_direction="push",
+            description="Syncs dev changes to staging"
+        )
+        test_pair = InstancePair(
+            name="Test Pair",
+            source_instance_id=source.id,
+            target_instance_id=target.id,
+            mirror_direction="push"
+        )
+        acme_pair = InstancePair(
+            name="Main Pair",
+            source_instance_id=acme.id,
+            target_instance_id=acme.id,
+            mirror_direction="pull",
+            description="Acme internal mirroring"
+        )
+        session.add_all([dev_pair, test_pair, acme_pair])
+        await session.flush()
+
+        session.add_all([
+            Mirror(
+                instance_pair_id=test_pair.id,
+                source_project_id=123,
+                source_project_path="mygroup/awesome-project",
+                target_project_id=456,
+                target_project_path="mygroup/awesome-project-mirror",
+                last_update_status="success"
+            ),
+            Mirror(
+                instance_pair_id=acme_pair.id,
+                source_project_id=1,
+                source_project_path="acme/core-lib",
+                target_project_id=2,
+                target_project_path="backup/core-lib"
+            ),
+        ])
+        await session.commit()
+
+
+@pytest.fixture()
+async def clean_db(search_corpus):
+    """The search tests only read, so they share ``search_corpus`` instead of emptying the tables."""
 
 
 @pytest.mark.asyncio
-async def test_search_finds_mirrors(client, db_session, monkeypatch):
-    """Test search finds matching mirrors."""
-    # Create instances and pair
-    source = GitLabInstance(
-        name="Source",
-        url="https://source.gitlab.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    target = GitLabInstance(
-        name="Target",
-        url="https://target.gitlab.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add_all([source, target])
-    await db_session.commit()
-
-    pair = InstancePair(
-        name="Test Pair",
-        source_instance_id=source.id,
-        target_instance_id=target.id,
-        mirror_direction="push"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
-    # Create mirror
-    mirror = Mirror(
-        instance_pair_id=pair.id,
-        source_project_id=123,
-        source_project_path="mygroup/awesome-project",
-        target_project_id=456,
-        target_project_path="mygroup/awesome-project-mirror",
-        last_update_status="success"
-    )
-    db_session.add(mirror)
-    await db_session.commit()
-
-    # Search by project path
-    response = await client.get("/api/search?q=awesome")
-    assert response.status_code == 200
-    data = response.json()
-    assert data["total_count"] == 1
-    assert len(data["mirrors"]) == 1
-    assert "awesome-project" in data["mirrors"][0]["title"]
-    assert data["mirrors"][0]["subtitle"] == "Status: success"
+async def test_search_requires_query(client):
+    """Test that search requires a query parameter."""
+    response = await client.get("/api/search")
+    assert response.status_code == 422  # Validation error
+
+
+# query -> expected (title, subtitle) hits per category in the seeded corpus
+SEARCH_CASES = {
+    "nomatch": {"instances": [], "pairs": [], "mirrors": []},
+    "production": {
+        "instances": [("Production GitLab", "https://gitlab.example.com")],
+        "pairs": [],
+        "mirrors": [],
+    },
+    "development": {
+        "instances": [],
+        "pairs": [("Development to Staging", "push mirror")],
+        "mirrors": [],
+    },
+    "awesome": {
+        "instances": [],
+        "pairs": [],
+        "mirrors": [("mygroup/awesome-project → mygroup/awesome-project-mirror", "Status: success")],
+    },
+    # "acme" matches an instance name, a pair description and a project path
+    "acme": {
+        "instances": [("Acme GitLab", "https://acme.gitlab.com")],
+        "pairs": [("Main Pair", "pull mirror")],
+        "mirrors": [("acme/core-lib → backup/core-lib", "Status: unknown")],
+    },
+}
 
 
 @pytest.mark.asyncio
-async def test_search_across_all_types(client, db_session, monkeypatch):
-    """Test search returns results from all entity types."""
-    # Create instance with matching name
-    instance = GitLabInstance(
-        name="Acme GitLab",
-        url="https://acme.gitlab.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    # Create pair with matching description
-    pair = InstancePair(
-        name="Main Pair",
-        source_instance_id=instance.id,
-        target_instance_id=instance.id,
-        mirror_direction="pull",
-        description="Acme internal mirroring"
-    )
-    db_session.add(pair)
-    await db_session.commit()
-
-    # Create mirror with matching project path
-    mirror = Mirror(
-        instance_pair_id=pair.id,
-        source_project_id=1,
-        source_project_path="acme/core-lib",
-        target_project_id=2,
-        target_project_path="backup/core-lib"
-    )
-    db_session.add(mirror)
-    await db_session.commit()
-
-    # Search for "acme"
-    response = await client.get("/api/search?q=acme")
+@pytest.mark.parametrize("query", list(SEARCH_CASES))
+async def test_search_results(client, query):
+    """Test search returns exactly the matching instances, pairs and mirrors."""
+    expected = SEARCH_CASES[query]
+    response = await client.get(f"/api/search?q={query}")
     assert response.status_code == 200
-    data = response.json()
-    assert data["total_count"] == 3
-    assert len(data["instances"]) == 1
-    assert len(data["pairs"]) == 1
-    assert len(data["mirrors"]) == 1
+    data = _json(response)
+    assert data["query"] == query
+    for category, hits in expected.items():
+        assert [(item["title"], item["subtitle"]) for item in data[category]] == hits, category
+    assert data["total_count"] == sum(len(hits) for hits in expected.values())
 
 
 @pytest.mark.asyncio
-async def test_search_limit_parameter(client, db_session, monkeypatch):
+async def test_search_limit_parameter(client):
     """Test search respects limit parameter."""
-    # Create multiple instances
-    for i in range(10):
-        instance = GitLabInstance(
-            name=f"Test Instance {i}",
-            url=f"https://test{i}.gitlab.com",
-            encrypted_token=encryption.encrypt("test-token")
-        )
-        db_session.add(instance)
-    await db_session.commit()
-
-    # Search with limit
     response = await client.get("/api/search?q=test&limit=3")
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert len(data["instances"]) == 3
 
 
 @pytest.mark.asyncio
-async def test_search_case_insensitive(client, db_session, monkeypatch):
+async def test_search_case_insensitive(client):
     """Test search is case-insensitive."""
-    instance = GitLabInstance(
-        name="MyGitLab",
-        url="https://gitlab.example.com",
-        encrypted_token=encryption.encrypt("test-token")
-    )
-    db_session.add(instance)
-    await db_session.commit()
-
-    # Search with different cases
-    for q in ["mygitlab", "MYGITLAB", "MyGitLab", "myGITLAB"]:
-        response = await client.get(f"/api/search?q={q}")
+    queries = ["mygitlab", "MYGITLAB", "MyGitLab", "myGITLAB"]
+    # The lookups are independent reads, so issue them concurrently
+    responses = await asyncio.gather(*(client.get(f"/api/search?q={q}") for q in queries))
+    for q, response in zip(queries, responses):
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert len(data["instances"]) == 1, f"Failed for query: {q}"
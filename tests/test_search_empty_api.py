@@ -0,0 +1,21 @@
+"""
+Search API against an empty database.
+
+Kept apart from test_search_api.py, whose tests share a seeded corpus: here
+``client`` comes with the normal ``clean_db``, so every table is empty.
+"""
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_search_empty_database(client):
+    """Test search on empty database returns no results."""
+    response = await client.get("/api/search?q=test")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["query"] == "test"
+    assert data["total_count"] == 0
+    assert data["instances"] == []
+    assert data["pairs"] == []
+    assert data["mirrors"] == []
@@ -5,6 +5,52 @@ import asyncio
 import pytest
 
 from app.core.tls_keepalive import TLSKeepAliveManager
+from tests.gitlab_fakes import FakeGitLabClient, patch_gitlab_client
+
+
+class FakeStdin:
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        pass
+
+
+class FakeProcess:
+    """Stands in for an ``openssl s_client`` process that holds its connection until terminated."""
+
+    def __init__(self):
+        self.stdin = FakeStdin()
+        self.returncode = None
+        self._exited = asyncio.Event()
+
+    async def wait(self):
+        await self._exited.wait()
+        return self.returncode
+
+    def terminate(self):
+        self.returncode = -15
+        self._exited.set()
+
+    kill = terminate
+
+
+@pytest.fixture(autouse=True)
+def spawned_sessions(monkeypatch):
+    """
+    Replace the ``openssl s_client`` subprocess with an in-process fake.
+
+    Keeps the manager tests from resolving and connecting to the example
+    hosts; returns the list of command lines the manager tried to run.
+    """
+    commands = []
+
+    async def fake_create_subprocess_exec(*cmd, **kwargs):
+        commands.append(list(cmd))
+        return FakeProcess()
+
+    monkeypatch.setattr("app.core.tls_keepalive._create_subprocess_exec", fake_create_subprocess_exec)
+    return commands
 
 
 class TestTLSKeepAliveManager:
@@ -21,7 +67,7 @@ class TestTLSKeepAliveManager:
         assert not manager.is_running
 
     @pytest.mark.asyncio
-    async def test_start_with_instances(self):
+    async def test_start_with_instances(self, spawned_sessions):
         manager = TLSKeepAliveManager(reconnect_interval=1)
         instances = [
             {"id": 1, "name": "Test GitLab", "url": "https://gitlab.example.com"},
@@ -31,6 +77,15 @@ class TestTLSKeepAliveManager:
         assert manager.is_running
         assert manager.active_count == 2
 
+        # Let the keep-alive tasks spawn their sessions, however they get scheduled
+        async with asyncio.timeout(1):
+            while len(spawned_sessions) < 2:
+                await asyncio.sleep(0)
+        assert sorted(cmd[3] for cmd in spawned_sessions) == [
+            "gitlab.example.com:443",
+            "gitlab2.example.com:8443",
+        ]
+
         status = manager.get_status()
         assert len(status) == 2
 
@@ -127,7 +182,6 @@ class TestTLSKeepAliveAPI:
     @pytest.mark.asyncio
     async def test_create_instance_with_tls_keepalive(self, client, monkeypatch):
         """Creating an instance with tls_keepalive_enabled stores the field."""
-        from tests.test_instances_api import FakeGitLabClient, patch_gitlab_client
         patch_gitlab_client(monkeypatch, FakeGitLabClient)
         FakeGitLabClient.test_ok = True
 
@@ -145,7 +199,6 @@ class TestTLSKeepAliveAPI:
     @pytest.mark.asyncio
     async def test_create_instance_default_tls_keepalive_false(self, client, monkeypatch):
         """By default, tls_keepalive_enabled is False."""
-        from tests.test_instances_api import FakeGitLabClient, patch_gitlab_client
         patch_gitlab_client(monkeypatch, FakeGitLabClient)
         FakeGitLabClient.test_ok = True
 
@@ -162,7 +215,6 @@ class TestTLSKeepAliveAPI:
     @pytest.mark.asyncio
     async def test_update_instance_tls_keepalive(self, client, monkeypatch):
         """Updating tls_keepalive_enabled via PUT works."""
-        from tests.test_instances_api import FakeGitLabClient, patch_gitlab_client
         patch_gitlab_client(monkeypatch, FakeGitLabClient)
         FakeGitLabClient.test_ok = True
 
@@ -193,7 +245,6 @@ class TestTLSKeepAliveAPI:
     @pytest.mark.asyncio
     async def test_list_instances_includes_tls_keepalive(self, client, monkeypatch):
         """List instances includes tls_keepalive_enabled field."""
-        from tests.test_instances_api import FakeGitLabClient, patch_gitlab_client
         patch_gitlab_client(monkeypatch, FakeGitLabClient)
         FakeGitLabClient.test_ok = True
 
@@ -1,124 +1,139 @@
+import asyncio
+
 import pytest
+from sqlalchemy import insert
 
 from app.models import GitLabInstance, InstancePair, Mirror
 from datetime import datetime, timedelta
 
 
-async def seed_instance(session_maker, *, name: str, url: str) -> int:
-    async with session_maker() as s:
-        inst = GitLabInstance(name=name, url=url, encrypted_token="enc:t", description="")
-        s.add(inst)
-        await s.commit()
-        await s.refresh(inst)
-        return inst.id
-
+async def seed_many(session_maker, *, instances, pairs=(), mirrors=()) -> tuple[list[int], list[int]]:
+    """
+    Seed instances, pairs and mirrors in one transaction; returns the instance and pair ids.
 
-async def seed_pair(session_maker, *, name: str, src_id: int, tgt_id: int, direction: str) -> int:
+    ``instances`` are ``(name, url)`` tuples and ``pairs`` are
+    ``(name, source_index, target_index, direction)`` tuples indexing into
+    ``instances``. Each mirror is a dict of ``Mirror`` columns whose ``pair``
+    key indexes into ``pairs`` in place of ``instance_pair_id``.
+    """
     async with session_maker() as s:
-        pair = InstancePair(
-            name=name,
-            source_instance_id=src_id,
-            target_instance_id=tgt_id,
-            mirror_direction=direction,
-        )
-        s.add(pair)
+        instance_ids = (
+            await s.execute(
+                insert(GitLabInstance).returning(GitLabInstance.id, sort_by_parameter_order=True),
+                [dict(name=name, url=url, encrypted_token="enc:t", description="") for name, url in instances],
+            )
+        ).scalars().all()
+        pair_ids = []
+        if pairs:
+            pair_ids = (
+                await s.execute(
+                    insert(InstancePair).returning(InstancePair.id, sort_by_parameter_order=True),
+                    [
+                        dict(
+                            name=name,
+                            source_instance_id=instance_ids[src],
+                            target_instance_id=instance_ids[tgt],
+                            mirror_direction=direction,
+                        )
+                        for name, src, tgt, direction in pairs
+                    ],
+                )
+            ).scalars().all()
+        if mirrors:
+            rows = []
+            for mirror in mirrors:
+                row = dict(mirror)
+                row["instance_pair_id"] = pair_ids[row.pop("pair")]
+                rows.append(row)
+            await s.execute(insert(Mirror), rows)
         await s.commit()
-        await s.refresh(pair)
-        return pair.id
+    return list(instance_ids), list(pair_ids)
 
 
 @pytest.mark.asyncio
 async def test_topology_aggregates_links_and_node_stats(client, session_maker):
-    a_id = await seed_instance(session_maker, name="A", url="https://a.example.com")
-    b_id = await seed_instance(session_maker, name="B", url="https://b.example.com")
-    c_id = await seed_instance(session_maker, name="C", url="https://c.example.com")
-
-    pair_ab = await seed_pair(session_maker, name="ab", src_id=a_id, tgt_id=b_id, direction="push")
-    pair_bc_pull = await seed_pair(session_maker, name="bc-pull", src_id=b_id, tgt_id=c_id, direction="pull")
-    pair_bc_push = await seed_pair(session_maker, name="bc-push", src_id=b_id, tgt_id=c_id, direction="push")
+    now = datetime.utcnow()
 
-    async with session_maker() as s:
-        # A -> B (push), 3 mirrors, 1 disabled
-        # Direction comes from pair, not stored on mirror
-        s.add_all(
-            [
-                Mirror(
-                    instance_pair_id=pair_ab,
-                    source_project_id=1,
-                    source_project_path="g/a1",
-                    target_project_id=2,
-                    target_project_path="g/b1",
-                    enabled=True,
-                    last_update_status="failed",
-                    last_successful_update=datetime.utcnow() - timedelta(hours=6),
-                ),
-                Mirror(
-                    instance_pair_id=pair_ab,
-                    source_project_id=3,
-                    source_project_path="g/a2",
-                    target_project_id=4,
-                    target_project_path="g/b2",
-                    enabled=True,
-                    last_update_status="finished",
-                    last_successful_update=datetime.utcnow() - timedelta(hours=1),
-                ),
-                Mirror(
-                    instance_pair_id=pair_ab,
-                    source_project_id=5,
-                    source_project_path="g/a3",
-                    target_project_id=6,
-                    target_project_path="g/b3",
-                    enabled=False,
-                    last_update_status="pending",
-                    last_successful_update=None,
-                ),
-            ]
-        )
-
-        # B -> C pull (via pull pair)
-        s.add(
-            Mirror(
-                instance_pair_id=pair_bc_pull,
+    # A -> B (push), 3 mirrors, 1 disabled; B -> C once via a pull pair and
+    # once via a push pair (separate link buckets).
+    # Direction comes from pair, not stored on mirror
+    (a_id, b_id, c_id), (pair_ab, _, _) = await seed_many(
+        session_maker,
+        instances=[(n, f"https://{n.lower()}.example.com") for n in ("A", "B", "C")],
+        pairs=[("ab", 0, 1, "push"), ("bc-pull", 1, 2, "pull"), ("bc-push", 1, 2, "push")],
+        mirrors=[
+            dict(
+                pair=0,
+                source_project_id=1,
+                source_project_path="g/a1",
+                target_project_id=2,
+                target_project_path="g/b1",
+                enabled=True,
+                last_update_status="failed",
+                last_successful_update=now - timedelta(hours=6),
+            ),
+            dict(
+                pair=0,
+                source_project_id=3,
+                source_project_path="g/a2",
+                target_project_id=4,
+                target_project_path="g/b2",
+                enabled=True,
+                last_update_status="finished",
+                last_successful_update=now - timedelta(hours=1),
+            ),
+            dict(
+                pair=0,
+                source_project_id=5,
+                source_project_path="g/a3",
+                target_project_id=6,
+                target_project_path="g/b3",
+                enabled=False,
+                last_update_status="pending",
+                last_successful_update=None,
+            ),
+            dict(
+                pair=1,
                 source_project_id=10,
                 source_project_path="g/bx",
                 target_project_id=20,
                 target_project_path="g/cx",
                 enabled=True,
                 last_update_status="pending",
-            )
-        )
-        # B -> C push (via push pair - separate link bucket)
-        s.add(
-            Mirror(
-                instance_pair_id=pair_bc_push,
+            ),
+            dict(
+                pair=2,
                 source_project_id=11,
                 source_project_path="g/by",
                 target_project_id=21,
                 target_project_path="g/cy",
                 enabled=True,
                 last_update_status="pending",
-            )
-        )
-
-        await s.commit()
+            ),
+        ],
+    )
 
-    resp = await client.get("/api/topology")
+    # The full and the pair-filtered topology are independent reads.
+    resp, filtered_resp = await asyncio.gather(
+        client.get("/api/topology"),
+        client.get(f"/api/topology?instance_pair_id={pair_ab}"),
+    )
     assert resp.status_code == 200, resp.text
     body = resp.json()
 
-    assert {n["name"] for n in body["nodes"]} == {"A", "B", "C"}
-
-    nodes_by_name = {n["name"]: n for n in body["nodes"]}
-    assert nodes_by_name["A"]["mirrors_out"] == 3
-    assert nodes_by_name["A"]["mirrors_in"] == 0
-    assert nodes_by_name["B"]["mirrors_in"] == 3
-    assert nodes_by_name["B"]["mirrors_out"] == 2
-    assert nodes_by_name["C"]["mirrors_in"] == 2
+    # Nodes come back sorted by name, so they unpack in order.
+    assert [n["name"] for n in body["nodes"]] == ["A", "B", "C"]
+    node_a, node_b, node_c = body["nodes"]
+    assert node_a["mirrors_out"] == 3
+    assert node_a["mirrors_in"] == 0
+    assert node_b["mirrors_in"] == 3
+    assert node_b["mirrors_out"] == 2
+    assert node_c["mirrors_in"] == 2
 
     # Node health should aggregate mirror statuses for any incident mirrors.
-    assert nodes_by_name["A"]["health"] == "error"
-    assert nodes_by_name["B"]["health"] == "error"
-    assert nodes_by_name["C"]["health"] == "warning"
+    assert node_a["health"] == "error"
+    assert node_b["health"] == "error"
+    assert node_c["health"] == "warning"
 
     links = body["links"]
     assert len(links) == 3
@@ -148,37 +163,39 @@ async def test_topology_aggregates_links_and_node_stats(client, session_maker):
     assert bc_push["mirror_count"] == 1
 
     # Pair filter should narrow the topology to one pair.
-    resp = await client.get(f"/api/topology?instance_pair_id={pair_ab}")
-    assert resp.status_code == 200, resp.text
-    filtered = resp.json()
+    assert filtered_resp.status_code == 200, filtered_resp.text
+    filtered = filtered_resp.json()
+    # The filtered view is the matching link from the full body above (the
+    # staleness age is recomputed per request and may tick over a second).
     assert len(filtered["links"]) == 1
-    assert filtered["links"][0]["source"] == a_id
-    assert filtered["links"][0]["target"] == b_id
-    assert filtered["links"][0]["mirror_direction"] == "push"
+    assert {k: v for k, v in filtered["links"][0].items() if k != "staleness_age_seconds"} == {
+        k: v for k, v in ab_push.items() if k != "staleness_age_seconds"
+    }
 
 
 @pytest.mark.asyncio
 async def test_topology_staleness_thresholds_influence_health(client, session_maker):
-    a_id = await seed_instance(session_maker, name="A", url="https://a.example.com")
-    b_id = await seed_instance(session_maker, name="B", url="https://b.example.com")
-    pair_ab = await seed_pair(session_maker, name="ab2", src_id=a_id, tgt_id=b_id, direction="push")
+    now = datetime.utcnow()
 
     # A single successful mirror, but very old.
     # Direction comes from pair, not stored on mirror
-    async with session_maker() as s:
-        s.add(
-            Mirror(
-                instance_pair_id=pair_ab,
+    await seed_many(
+        session_maker,
+        instances=[("A", "https://a.example.com"), ("B", "https://b.example.com")],
+        pairs=[("ab2", 0, 1, "push")],
+        mirrors=[
+            dict(
+                pair=0,
                 source_project_id=1,
                 source_project_path="g/a1",
                 target_project_id=2,
                 target_project_path="g/b1",
                 enabled=True,
                 last_update_status="finished",
-                last_successful_update=datetime.utcnow() - timedelta(hours=10),
+                last_successful_update=now - timedelta(hours=10),
             )
-        )
-        await s.commit()
+        ],
+    )
 
     # Force thresholds small so this becomes "stale error"
     resp = await client.get("/api/topology?stale_warning_seconds=60&stale_error_seconds=120")
@@ -190,25 +207,25 @@ async def test_topology_staleness_thresholds_influence_health(client, session_ma
     assert link["staleness"] == "error"
     assert link["health"] in {"error"}  # staleness should elevate
 
-    nodes_by_name = {n["name"]: n for n in body["nodes"]}
-    assert nodes_by_name["A"]["staleness"] == "error"
-    assert nodes_by_name["B"]["staleness"] == "error"
-    assert nodes_by_name["A"]["health"] == "error"
-    assert nodes_by_name["B"]["health"] == "error"
+    node_a, node_b = body["nodes"]
+    assert (node_a["name"], node_b["name"]) == ("A", "B")
+    assert node_a["staleness"] == "error"
+    assert node_b["staleness"] == "error"
+    assert node_a["health"] == "error"
+    assert node_b["health"] == "error"
 
 
 @pytest.mark.asyncio
 async def test_topology_never_succeeded_level_can_be_error(client, session_maker):
-    a_id = await seed_instance(session_maker, name="A", url="https://a.example.com")
-    b_id = await seed_instance(session_maker, name="B", url="https://b.example.com")
-    pair_ab = await seed_pair(session_maker, name="ab3", src_id=a_id, tgt_id=b_id, direction="pull")
-
     # Mirror exists but has never recorded a successful update timestamp.
     # Direction comes from pair, not stored on mirror
-    async with session_maker() as s:
-        s.add(
-            Mirror(
-                instance_pair_id=pair_ab,
+    await seed_many(
+        session_maker,
+        instances=[("A", "https://a.example.com"), ("B", "https://b.example.com")],
+        pairs=[("ab3", 0, 1, "pull")],
+        mirrors=[
+            dict(
+                pair=0,
                 source_project_id=1,
                 source_project_path="g/a1",
                 target_project_id=2,
@@ -217,11 +234,15 @@ async def test_topology_never_succeeded_level_can_be_error(client, session_maker
                 last_update_status="pending",
                 last_successful_update=None,
             )
-        )
-        await s.commit()
+        ],
+    )
+
+    resp, resp2 = await asyncio.gather(
+        client.get("/api/topology"),
+        client.get("/api/topology?never_succeeded_level=error"),
+    )
 
     # Default: never succeeded => staleness warning
-    resp = await client.get("/api/topology")
     assert resp.status_code == 200, resp.text
     body = resp.json()
     link = body["links"][0]
@@ -229,9 +250,8 @@ async def test_topology_never_succeeded_level_can_be_error(client, session_maker
     assert link["staleness"] == "warning"
 
     # Override: never succeeded => staleness error
-    resp = await client.get("/api/topology?never_succeeded_level=error")
-    assert resp.status_code == 200, resp.text
-    body2 = resp.json()
+    assert resp2.status_code == 200, resp2.text
+    body2 = resp2.json()
     link2 = body2["links"][0]
     assert link2["never_succeeded_count"] == 1
     assert link2["staleness"] == "error"
@@ -240,52 +260,54 @@ async def test_topology_never_succeeded_level_can_be_error(client, session_maker
 
 @pytest.mark.asyncio
 async def test_topology_link_mirrors_drilldown_filters_and_sorts(client, session_maker):
-    a_id = await seed_instance(session_maker, name="A", url="https://a.example.com")
-    b_id = await seed_instance(session_maker, name="B", url="https://b.example.com")
-    pair_ab = await seed_pair(session_maker, name="ab4", src_id=a_id, tgt_id=b_id, direction="push")
+    now = datetime.utcnow()
+
+    # One failed (worst), one finished (best), one disabled pending (should be filtered if include_disabled=false)
+    (a_id, b_id), _ = await seed_many(
+        session_maker,
+        instances=[("A", "https://a.example.com"), ("B", "https://b.example.com")],
+        pairs=[("ab4", 0, 1, "push")],
+        mirrors=[
+            dict(
+                pair=0,
+                source_project_id=1,
+                source_project_path="g/a1",
+                target_project_id=2,
+                target_project_path="g/b1",
+                enabled=True,
+                last_update_status="failed",
+                last_successful_update=now - timedelta(hours=2),
+            ),
+            dict(
+                pair=0,
+                source_project_id=3,
+                source_project_path="g/a2",
+                target_project_id=4,
+                target_project_path="g/b2",
+                enabled=True,
+                last_update_status="finished",
+                last_successful_update=now - timedelta(hours=1),
+            ),
+            dict(
+                pair=0,
+                source_project_id=5,
+                source_project_path="g/a3",
+                target_project_id=6,
+                target_project_path="g/b3",
+                enabled=False,
+                last_update_status="pending",
+                last_successful_update=None,
+            ),
+        ],
+    )
 
-    async with session_maker() as s:
-        # One failed (worst), one finished (best), one disabled pending (should be filtered if include_disabled=false)
-        s.add_all(
-            [
-                Mirror(
-                    instance_pair_id=pair_ab,
-                    source_project_id=1,
-                    source_project_path="g/a1",
-                    target_project_id=2,
-                    target_project_path="g/b1",
-                    enabled=True,
-                    last_update_status="failed",
-                    last_successful_update=datetime.utcnow() - timedelta(hours=2),
-                ),
-                Mirror(
-                    instance_pair_id=pair_ab,
-                    source_project_id=3,
-                    source_project_path="g/a2",
-                    target_project_id=4,
-                    target_project_path="g/b2",
-                    enabled=True,
-                    last_update_status="finished",
-                    last_successful_update=datetime.utcnow() - timedelta(hours=1),
-                ),
-                Mirror(
-                    instance_pair_id=pair_ab,
-                    source_project_id=5,
-                    source_project_path="g/a3",
-                    target_project_id=6,
-                    target_project_path="g/b3",
-                    enabled=False,
-                    last_update_status="pending",
-                    last_successful_update=None,
-                ),
-            ]
-        )
-        await s.commit()
+    link_url = f"/api/topology/link-mirrors?source_instance_id={a_id}&target_instance_id={b_id}&mirror_direction=push"
+    resp, resp2 = await asyncio.gather(
+        client.get(f"{link_url}&include_disabled=false"),
+        client.get(f"{link_url}&include_disabled=true"),
+    )
 
     # include_disabled=false should exclude the disabled mirror
-    resp = await client.get(
-        f"/api/topology/link-mirrors?source_instance_id={a_id}&target_instance_id={b_id}&mirror_direction=push&include_disabled=false"
-    )
     assert resp.status_code == 200, resp.text
     body = resp.json()
     assert body["total"] == 2
@@ -295,11 +317,8 @@ async def test_topology_link_mirrors_drilldown_filters_and_sorts(client, session
     assert body["mirrors"][0]["health"] == "error"
 
     # include_disabled=true should include all
-    resp = await client.get(
-        f"/api/topology/link-mirrors?source_instance_id={a_id}&target_instance_id={b_id}&mirror_direction=push&include_disabled=true"
-    )
-    assert resp.status_code == 200, resp.text
-    body2 = resp.json()
+    assert resp2.status_code == 200, resp2.text
+    body2 = resp2.json()
     assert body2["total"] == 3
     assert len(body2["mirrors"]) == 3
 
@@ -315,62 +334,54 @@ async def test_topology_bidirectional_shows_two_links(client, session_maker):
     3. Each link has correct source, target, and direction
     4. Node stats correctly aggregate mirrors from both directions
     """
-    a_id = await seed_instance(session_maker, name="Production", url="https://prod.example.com")
-    b_id = await seed_instance(session_maker, name="Staging", url="https://staging.example.com")
-
-    # Create bidirectional pairs: A→B (push) and B→A (push)
-    pair_ab = await seed_pair(session_maker, name="prod-to-staging", src_id=a_id, tgt_id=b_id, direction="push")
-    pair_ba = await seed_pair(session_maker, name="staging-to-prod", src_id=b_id, tgt_id=a_id, direction="push")
-
-    async with session_maker() as s:
-        # A→B mirrors (2 mirrors)
-        s.add_all([
-            Mirror(
-                instance_pair_id=pair_ab,
+    now = datetime.utcnow()
+
+    # Bidirectional pairs: A→B (push) with 2 mirrors and B→A (push) with 1 mirror
+    (a_id, b_id), _ = await seed_many(
+        session_maker,
+        instances=[("Production", "https://prod.example.com"), ("Staging", "https://staging.example.com")],
+        pairs=[("prod-to-staging", 0, 1, "push"), ("staging-to-prod", 1, 0, "push")],
+        mirrors=[
+            dict(
+                pair=0,
                 source_project_id=1,
                 source_project_path="prod/service-a",
                 target_project_id=101,
                 target_project_path="staging/service-a",
                 enabled=True,
                 last_update_status="finished",
-                last_successful_update=datetime.utcnow() - timedelta(hours=1),
+                last_successful_update=now - timedelta(hours=1),
             ),
-            Mirror(
-                instance_pair_id=pair_ab,
+            dict(
+                pair=0,
                 source_project_id=2,
                 source_project_path="prod/service-b",
                 target_project_id=102,
                 target_project_path="staging/service-b",
                 enabled=True,
                 last_update_status="finished",
-                last_successful_update=datetime.utcnow() - timedelta(hours=2),
+                last_successful_update=now - timedelta(hours=2),
             ),
-        ])
-
-        # B→A mirrors (1 mirror)
-        s.add(
-            Mirror(
-                instance_pair_id=pair_ba,
+            dict(
+                pair=1,
                 source_project_id=103,
                 source_project_path="staging/hotfix",
                 target_project_id=3,
                 target_project_path="prod/hotfix",
                 enabled=True,
                 last_update_status="finished",
-                last_successful_update=datetime.utcnow() - timedelta(minutes=30),
-            )
-        )
-        await s.commit()
+                last_successful_update=now - timedelta(minutes=30),
+            ),
+        ],
+    )
 
     resp = await client.get("/api/topology")
     assert resp.status_code == 200, resp.text
     body = resp.json()
 
     # Should have exactly 2 nodes
-    assert len(body["nodes"]) == 2
-    nodes_by_name = {n["name"]: n for n in body["nodes"]}
-    assert "Production" in nodes_by_name
-    assert "Staging" in nodes_by_name
+    assert [n["name"] for n in body["nodes"]] == ["Production", "Staging"]
+    prod_node, staging_node = body["nodes"]
 
     # Should have exactly 2 links (one for each direction)
     assert len(body["links"]) == 2
@@ -391,9 +402,6 @@ async def test_topology_bidirectional_shows_two_links(client, session_maker):
     assert ba_link["pair_count"] == 1
 
     # Verify node stats aggregate correctly
-    prod_node = nodes_by_name["Production"]
-    staging_node = nodes_by_name["Staging"]
-
     # Production: 2 mirrors out (to staging), 1 mirror in (from staging)
     assert prod_node["mirrors_out"] == 2
     assert prod_node["mirrors_in"] == 1
@@ -410,40 +418,35 @@ async def test_topology_bidirectional_different_directions(client, session_maker
 
     A→B with push, B→A with pull should create two distinct links.
     """
-    a_id = await seed_instance(session_maker, name="Primary", url="https://primary.example.com")
-    b_id = await seed_instance(session_maker, name="Secondary", url="https://secondary.example.com")
-
-    # Create pairs with different directions
-    pair_ab_push = await seed_pair(session_maker, name="primary-push-to-secondary", src_id=a_id, tgt_id=b_id, direction="push")
-    pair_ba_pull = await seed_pair(session_maker, name="secondary-pull-to-primary", src_id=b_id, tgt_id=a_id, direction="pull")
-
-    async with session_maker() as s:
-        # A→B push mirror
-        s.add(
-            Mirror(
-                instance_pair_id=pair_ab_push,
+    now = datetime.utcnow()
+
+    # A→B push mirror and B→A pull mirror
+    (a_id, b_id), _ = await seed_many(
+        session_maker,
+        instances=[("Primary", "https://primary.example.com"), ("Secondary", "https://secondary.example.com")],
+        pairs=[("primary-push-to-secondary", 0, 1, "push"), ("secondary-pull-to-primary", 1, 0, "pull")],
+        mirrors=[
+            dict(
+                pair=0,
                 source_project_id=1,
                 source_project_path="primary/app",
                 target_project_id=101,
                 target_project_path="secondary/app",
                 enabled=True,
                 last_update_status="finished",
-                last_successful_update=datetime.utcnow() - timedelta(minutes=30),
-            )
-        )
-        # B→A pull mirror
-        s.add(
-            Mirror(
-                instance_pair_id=pair_ba_pull,
+                last_successful_update=now - timedelta(minutes=30),
+            ),
+            dict(
+                pair=1,
                 source_project_id=102,
                 source_project_path="secondary/config",
                 target_project_id=2,
                 target_project_path="primary/config",
                 enabled=True,
                 last_update_status="pending",
-            )
-        )
-        await s.commit()
+            ),
+        ],
+    )
 
     resp = await client.get("/api/topology")
     assert resp.status_code == 200, resp.text
@@ -478,18 +481,15 @@ async def test_topology_link_mirrors_bidirectional_drilldown(client, session_mak
 
     Each direction should only show mirrors belonging to pairs in that direction.
     """
-    a_id = await seed_instance(session_maker, name="A", url="https://a.example.com")
-    b_id = await seed_instance(session_maker, name="B", url="https://b.example.com")
-
-    pair_ab = await seed_pair(session_maker, name="a-to-b", src_id=a_id, tgt_id=b_id, direction="push")
-    pair_ba = await seed_pair(session_maker, name="b-to-a", src_id=b_id, tgt_id=a_id, direction="push")
-
-    async with session_maker() as s:
-        # 3 mirrors on A→B
-        for i in range(3):
-            s.add(
-                Mirror(
-                    instance_pair_id=pair_ab,
+    # 3 mirrors on A→B, 2 mirrors on B→A
+    (a_id, b_id), _ = await seed_many(
+        session_maker,
+        instances=[("A", "https://a.example.com"), ("B", "https://b.example.com")],
+        pairs=[("a-to-b", 0, 1, "push"), ("b-to-a", 1, 0, "push")],
+        mirrors=[
+            *(
+                dict(
+                    pair=0,
                     source_project_id=i + 1,
                     source_project_path=f"a/proj{i}",
                     target_project_id=i + 101,
@@ -497,13 +497,11 @@ async def test_topology_link_mirrors_bidirectional_drilldown(client, session_mak
                     enabled=True,
                     last_update_status="finished",
                 )
-            )
-
-        # 2 mirrors on B→A
-        for i in range(2):
-            s.add(
-                Mirror(
-                    instance_pair_id=pair_ba,
+                for i in range(3)
+            ),
+            *(
+                dict(
+                    pair=1,
                     source_project_id=i + 201,
                     source_project_path=f"b/back{i}",
                     target_project_id=i + 11,
@@ -511,23 +509,23 @@ async def test_topology_link_mirrors_bidirectional_drilldown(client, session_mak
                     enabled=True,
                     last_update_status="finished",
                 )
-            )
+                for i in range(2)
+            ),
+        ],
+    )
 
-        await s.commit()
+    resp_ab, resp_ba = await asyncio.gather(
+        client.get(f"/api/topology/link-mirrors?source_instance_id={a_id}&target_instance_id={b_id}&mirror_direction=push"),
+        client.get(f"/api/topology/link-mirrors?source_instance_id={b_id}&target_instance_id={a_id}&mirror_direction=push"),
+    )
 
     # Drilldown on A→B link should show 3 mirrors
-    resp_ab = await client.get(
-        f"/api/topology/link-mirrors?source_instance_id={a_id}&target_instance_id={b_id}&mirror_direction=push"
-    )
     assert resp_ab.status_code == 200
     body_ab = resp_ab.json()
     assert body_ab["total"] == 3
     assert all(m["instance_pair_name"] == "a-to-b" for m in body_ab["mirrors"])
 
     # Drilldown on B→A link should show 2 mirrors
-    resp_ba = await client.get(
-        f"/api/topology/link-mirrors?source_instance_id={b_id}&target_instance_id={a_id}&mirror_direction=push"
-    )
     assert resp_ba.status_code == 200
     body_ba = resp_ba.json()
     assert body_ba["total"] == 2